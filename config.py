@@ -1,54 +1,115 @@
 """
 Configuration for the runner manager.
 """
-from pydantic_settings import BaseSettings
-from typing import Optional
+import os
+import threading
+import time
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING
+from urllib.parse import SplitResult, urlsplit
 
-from geppetto.data.models.cdn import CdnConfig
+if TYPE_CHECKING:
+    from geppetto.data.models.cdn import CdnConfig
 
 
-class Settings(BaseSettings):
-    """Runner manager configuration."""
-    
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+def _coerce_bool(raw: str) -> bool:
+    return raw.strip().lower() in _TRUTHY
+
+
+# Per-type coercers for environment values; anything not listed is kept
+# as the raw string.
+_COERCERS = {
+    bool: _coerce_bool,
+    int: int,
+    float: float,
+}
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Runner manager configuration.
+
+    A plain dataclass instead of pydantic BaseSettings: the fields are all
+    simple scalars, so a manual environment read avoids building a
+    pydantic-core schema at startup.
+    """
+
     # Database
     DATABASE_URL: str = "postgresql://localhost:5432/cricket"
-    
+
     # CDN Configuration for report uploads
     CDN_URL: str = ""
     CDN_ACCESS_KEY: str = ""
     CDN_SECRET_KEY: str = ""
     CDN_BUCKET_NAME: str = ""
     CDN_ENABLE_SSL: bool = True
-    
+
     # Report callback URL (notified after CDN upload)
     ENLIQ_REPORT_CALLBACK_URL: str = ""
-    
+
     # Scheduler settings
     MAX_QUEUE_SIZE: int = 10
     SCHEDULER_CHECK_INTERVAL: float = 60.0  # seconds
-    
+
     # Executor settings
     EXECUTION_TIMEOUT: int = 600  # 10 minutes
-    WORK_DIR: Optional[str] = None  # Default: temp directory
-    
+    WORK_DIR: str | None = None  # Default: temp directory
+
     # API settings
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8080
-    
-    class Config:
-        env_file = ".env"
-        extra = "ignore"
 
-    def get_cdn_config(self) -> Optional[CdnConfig]:
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Build a Settings instance from os.environ.
+
+        Unset variables fall back to the field defaults; unknown
+        environment variables are ignored.
+        """
+        environ = os.environ
+        values = {
+            name: coerce(environ[name])
+            for name, coerce in _ENV_FIELDS
+            if name in environ
+        }
+        return cls(**values)
+
+    @cached_property
+    def cdn_url_parts(self) -> SplitResult | None:
+        """Pre-parsed CDN_URL, split once per Settings instance."""
+        return urlsplit(self.CDN_URL) if self.CDN_URL else None
+
+    @cached_property
+    def callback_url_parts(self) -> SplitResult | None:
+        """Pre-parsed ENLIQ_REPORT_CALLBACK_URL, split once per instance."""
+        if not self.ENLIQ_REPORT_CALLBACK_URL:
+            return None
+        return urlsplit(self.ENLIQ_REPORT_CALLBACK_URL)
+
+    @cached_property
+    def cdn_config(self) -> "CdnConfig | None":
         """
-        Get CDN configuration if all required fields are set.
-        
+        CDN configuration if all required fields are set.
+
+        Built once per Settings instance; repeated access returns the
+        same CdnConfig without re-running validation.
+
         Returns:
             CdnConfig if configured, None otherwise
         """
         if not all([self.CDN_URL, self.CDN_ACCESS_KEY, self.CDN_SECRET_KEY, self.CDN_BUCKET_NAME]):
             return None
-        
+
+        # Imported lazily so importing config does not pay for building
+        # the CdnConfig pydantic schema when CDN is unconfigured.
+        from geppetto.data.models.cdn import CdnConfig
+
         return CdnConfig(
             cdn_url=self.CDN_URL,
             access_key=self.CDN_ACCESS_KEY,
@@ -58,4 +119,87 @@ class Settings(BaseSettings):
         )
 
 
-settings = Settings()
+# Known field names with their coercers, resolved once at import so
+# from_env() filters the environment without re-inspecting the dataclass.
+_ENV_FIELDS = tuple(
+    (field.name, _COERCERS.get(field.type, str)) for field in fields(Settings)
+)
+
+
+# Stale-while-revalidate cache for CDN reachability. The upload path
+# reads the last known answer immediately; an expired entry is served
+# stale while a background thread refreshes it, so report uploads never
+# block on an S3 probe.
+_CDN_LIVENESS_TTL = 60.0  # seconds
+_cdn_liveness = {"checked_at": 0.0, "alive": None}
+_cdn_liveness_lock = threading.Lock()
+
+
+def _probe_cdn(cdn_config: "CdnConfig") -> bool:
+    """Check bucket reachability with a single head_bucket call."""
+    import boto3
+
+    try:
+        client = boto3.client(
+            "s3",
+            endpoint_url=cdn_config.cdn_url,
+            aws_access_key_id=cdn_config.access_key,
+            aws_secret_access_key=cdn_config.secret_key,
+            use_ssl=cdn_config.enable_ssl,
+        )
+        client.head_bucket(Bucket=cdn_config.bucket_name)
+        return True
+    except Exception:
+        return False
+
+
+def _refresh_cdn_liveness(cdn_config: "CdnConfig") -> None:
+    alive = _probe_cdn(cdn_config)
+    with _cdn_liveness_lock:
+        _cdn_liveness["alive"] = alive
+        _cdn_liveness["checked_at"] = time.monotonic()
+
+
+def is_cdn_alive() -> bool | None:
+    """
+    Last known CDN reachability, refreshed in the background.
+
+    Returns None when CDN is unconfigured. An expired answer is served
+    stale while a refresh runs in a daemon thread; if the refresh fails,
+    callers keep getting the stale value rather than blocking.
+    """
+    cdn_config = get_settings().cdn_config
+    if cdn_config is None:
+        return None
+
+    with _cdn_liveness_lock:
+        age = time.monotonic() - _cdn_liveness["checked_at"]
+        alive = _cdn_liveness["alive"]
+        fresh = alive is not None and age < _CDN_LIVENESS_TTL
+
+    if not fresh:
+        refresher = threading.Thread(
+            target=_refresh_cdn_liveness,
+            args=(cdn_config,),
+            daemon=True,
+            name="cdn-liveness",
+        )
+        refresher.start()
+        if alive is None:
+            # First call has nothing stale to serve; wait for the probe.
+            refresher.join()
+            with _cdn_liveness_lock:
+                alive = _cdn_liveness["alive"]
+
+    return alive
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the cached Settings instance.
+
+    Deferring instantiation means importing this module does not read the
+    environment; the cost is paid once on first access.
+    """
+    return Settings.from_env()
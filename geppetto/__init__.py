@@ -1,10 +1,6 @@
 """
 Geppetto - The code synthesis and execution engine for Cricket Runner Manager.
 """
-# from geppetto.scheduler import ProjectScheduler
-# from geppetto.executor import ProjectExecutor
-# from geppetto.api import create_monitoring_api
-# from geppetto.db.client import DatabaseClient
 
 __all__ = [
     "ProjectScheduler",
@@ -13,4 +9,25 @@ __all__ = [
     "create_monitoring_api",
 ]
 
-version = "0.1.0"
\ No newline at end of file
+version = "0.1.0"
+
+# Map of public names to the submodules that define them. The heavy
+# submodules (fastapi, pydantic models, DB driver) are only imported when
+# one of these attributes is first accessed (PEP 562).
+_LAZY_IMPORTS = {
+    "ProjectScheduler": "geppetto.scheduler",
+    "ProjectExecutor": "geppetto.executor",
+    "DatabaseClient": "geppetto.db.client",
+    "create_monitoring_api": "geppetto.api",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
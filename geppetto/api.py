@@ -2,19 +2,24 @@
 Monitoring API for the runner manager.
 Provides endpoints to check project status, execution history, and queue state.
 """
-from datetime import datetime
-from typing import List, Optional
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Annotated, Iterator, Optional
 
-from fastapi import FastAPI, HTTPException, Query, Path
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Path, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
-from geppetto.data.models.execution import (
-    ExecutionStatus,
-    ProjectExecution,
-    RunnerStatus,
-)
-from geppetto.db.client import DatabaseClient
-from geppetto.scheduler import ProjectScheduler
+from geppetto.data.models.execution import ExecutionStatus
+
+if TYPE_CHECKING:
+    from geppetto.data.models.execution import ProjectExecution
+    from geppetto.db.client import DatabaseClient
+    from geppetto.scheduler import ProjectScheduler
 
 
 # =============================================================================
@@ -22,6 +27,15 @@ from geppetto.scheduler import ProjectScheduler
 # =============================================================================
 
 
+# Shared Annotated aliases for fields that recur across models. One
+# FieldInfo per alias instead of one per declaration keeps the pydantic
+# schema graph smaller.
+ProjectId = Annotated[str, Field(description="Unique project identifier")]
+ProjectName = Annotated[str, Field(description="Human-readable project name")]
+CronExpr = Annotated[str, Field(description="Cron expression defining the schedule")]
+ScheduleTimezone = Annotated[str, Field(description="IANA timezone for schedule interpretation")]
+
+
 class ExecutionResponse(BaseModel):
     """
     Detailed execution record for a project run.
@@ -29,70 +43,21 @@ class ExecutionResponse(BaseModel):
     Contains all information about a single execution including timing,
     status, and any error details.
     """
-    id: int = Field(..., description="Unique execution identifier", example=12345)
-    project_id: str = Field(
-        ..., 
-        description="Project identifier this execution belongs to",
-        example="order-validation"
-    )
-    status: str = Field(
-        ..., 
-        description="Current execution status",
-        example="success",
-        json_schema_extra={"enum": ["pending", "running", "success", "failed", "cancelled", "timeout"]}
-    )
-    scheduled_for: datetime = Field(
-        ..., 
-        description="Originally scheduled execution time (UTC)",
-        example="2026-01-09T10:00:00Z"
-    )
-    started_at: Optional[datetime] = Field(
-        None, 
-        description="Actual start time of execution (UTC)",
-        example="2026-01-09T10:00:02Z"
-    )
-    finished_at: Optional[datetime] = Field(
-        None, 
-        description="Completion time of execution (UTC)",
-        example="2026-01-09T10:02:45Z"
-    )
-    duration_seconds: Optional[float] = Field(
-        None, 
-        description="Total execution duration in seconds",
-        example=163.5
-    )
-    exit_code: Optional[int] = Field(
-        None, 
-        description="Process exit code (0 = success)",
-        example=0
-    )
-    error_message: Optional[str] = Field(
-        None, 
-        description="Error details if execution failed",
-        example=None
-    )
-    created_at: Optional[datetime] = Field(
-        None, 
-        description="Record creation timestamp (UTC)",
-        example="2026-01-09T10:00:00Z"
-    )
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "id": 12345,
-                "project_id": "order-validation",
-                "status": "success",
-                "scheduled_for": "2026-01-09T10:00:00Z",
-                "started_at": "2026-01-09T10:00:02Z",
-                "finished_at": "2026-01-09T10:02:45Z",
-                "duration_seconds": 163.5,
-                "exit_code": 0,
-                "error_message": None,
-                "created_at": "2026-01-09T10:00:00Z"
-            }
-        }
-    }
+    id: int = Field(..., description="Unique execution identifier")
+    project_id: ProjectId
+    status: str = Field(..., description="Current execution status")
+    scheduled_for: datetime = Field(..., description="Originally scheduled execution time (UTC)")
+    started_at: Optional[datetime] = Field(None, description="Actual start time of execution (UTC)")
+    finished_at: Optional[datetime] = Field(None, description="Completion time of execution (UTC)")
+    duration_seconds: Optional[float] = Field(None, description="Total execution duration in seconds")
+    exit_code: Optional[int] = Field(None, description="Process exit code (0 = success)")
+    error_message: Optional[str] = Field(None, description="Error details if execution failed")
+    created_at: Optional[datetime] = Field(None, description="Record creation timestamp (UTC)")
+
+    # Instances come from the trusted DB layer, usually via
+    # model_construct; never re-validate them when they are nested into
+    # another response model.
+    model_config = ConfigDict(from_attributes=True, revalidate_instances="never")
 
 
 class ProjectStatusResponse(BaseModel):
@@ -101,65 +66,18 @@ class ProjectStatusResponse(BaseModel):
     
     Includes scheduling details and the most recent execution.
     """
-    project_id: str = Field(
-        ..., 
-        description="Unique project identifier",
-        example="order-validation"
-    )
-    project_name: str = Field(
-        ..., 
-        description="Human-readable project name",
-        example="Order Validation Rules"
-    )
-    is_scheduled: bool = Field(
-        ..., 
-        description="Whether the project is currently scheduled for execution",
-        example=True
-    )
-    next_run: Optional[datetime] = Field(
-        None, 
-        description="Next scheduled execution time (UTC)",
-        example="2026-01-09T11:00:00Z"
-    )
-    cron_expression: str = Field(
-        ..., 
-        description="Cron expression defining the schedule",
-        example="0 * * * *"
-    )
-    timezone: str = Field(
-        ..., 
-        description="IANA timezone for schedule interpretation",
-        example="Europe/Istanbul"
-    )
+    project_id: ProjectId
+    project_name: ProjectName
+    is_scheduled: bool = Field(..., description="Whether the project is currently scheduled for execution")
+    next_run: Optional[datetime] = Field(None, description="Next scheduled execution time (UTC)")
+    cron_expression: CronExpr
+    timezone: ScheduleTimezone
     last_execution: Optional[ExecutionResponse] = Field(
-        None, 
+        None,
         description="Most recent execution record, if any"
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "project_id": "order-validation",
-                "project_name": "Order Validation Rules",
-                "is_scheduled": True,
-                "next_run": "2026-01-09T11:00:00Z",
-                "cron_expression": "0 * * * *",
-                "timezone": "Europe/Istanbul",
-                "last_execution": {
-                    "id": 12345,
-                    "project_id": "order-validation",
-                    "status": "success",
-                    "scheduled_for": "2026-01-09T10:00:00Z",
-                    "started_at": "2026-01-09T10:00:02Z",
-                    "finished_at": "2026-01-09T10:02:45Z",
-                    "duration_seconds": 163.5,
-                    "exit_code": 0,
-                    "error_message": None,
-                    "created_at": "2026-01-09T10:00:00Z"
-                }
-            }
-        }
-    }
+    model_config = ConfigDict(from_attributes=True, revalidate_instances="never")
 
 
 class QueueItemResponse(BaseModel):
@@ -168,43 +86,13 @@ class QueueItemResponse(BaseModel):
     
     Represents a pending scheduled execution waiting to be run.
     """
-    project_id: str = Field(
-        ..., 
-        description="Unique project identifier",
-        example="order-validation"
-    )
-    project_name: str = Field(
-        ..., 
-        description="Human-readable project name",
-        example="Order Validation Rules"
-    )
-    next_run: datetime = Field(
-        ..., 
-        description="Scheduled execution time (UTC)",
-        example="2026-01-09T11:00:00Z"
-    )
-    cron_expression: str = Field(
-        ..., 
-        description="Cron expression defining the schedule",
-        example="0 * * * *"
-    )
-    timezone: str = Field(
-        ..., 
-        description="IANA timezone for schedule interpretation",
-        example="Europe/Istanbul"
-    )
+    project_id: ProjectId
+    project_name: ProjectName
+    next_run: datetime = Field(..., description="Scheduled execution time (UTC)")
+    cron_expression: CronExpr
+    timezone: ScheduleTimezone
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "project_id": "order-validation",
-                "project_name": "Order Validation Rules",
-                "next_run": "2026-01-09T11:00:00Z",
-                "cron_expression": "0 * * * *",
-                "timezone": "Europe/Istanbul"
-            }
-        }
-    }
+    model_config = ConfigDict(from_attributes=True, revalidate_instances="never")
 
 
 class StatsResponse(BaseModel):
@@ -213,33 +101,14 @@ class StatsResponse(BaseModel):
     
     Provides counts of executions by status and overall success rate.
     """
-    total: int = Field(..., description="Total number of executions", example=1250)
-    pending: int = Field(..., description="Executions waiting to start", example=2)
-    running: int = Field(..., description="Currently executing projects", example=1)
-    success: int = Field(..., description="Successfully completed executions", example=1180)
-    failed: int = Field(..., description="Failed executions", example=45)
-    cancelled: int = Field(..., description="Cancelled executions", example=12)
-    timeout: int = Field(..., description="Executions that timed out", example=10)
-    success_rate: float = Field(
-        ..., 
-        description="Percentage of successful executions (0-100)",
-        example=94.40
-    )
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "total": 1250,
-                "pending": 2,
-                "running": 1,
-                "success": 1180,
-                "failed": 45,
-                "cancelled": 12,
-                "timeout": 10,
-                "success_rate": 94.40
-            }
-        }
-    }
+    total: int = Field(..., description="Total number of executions")
+    pending: int = Field(..., description="Executions waiting to start")
+    running: int = Field(..., description="Currently executing projects")
+    success: int = Field(..., description="Successfully completed executions")
+    failed: int = Field(..., description="Failed executions")
+    cancelled: int = Field(..., description="Cancelled executions")
+    timeout: int = Field(..., description="Executions that timed out")
+    success_rate: float = Field(..., description="Percentage of successful executions (0-100)")
 
 
 class HealthResponse(BaseModel):
@@ -248,177 +117,355 @@ class HealthResponse(BaseModel):
     
     Used for container orchestration health checks and monitoring.
     """
-    status: str = Field(
-        ..., 
-        description="Overall health status",
-        example="healthy"
-    )
-    runner_active: bool = Field(
-        ..., 
-        description="Whether the scheduler is actively running",
-        example=True
-    )
-    projects_in_queue: int = Field(
-        ..., 
-        description="Number of projects currently in the scheduling queue",
-        example=5
-    )
-    currently_executing: Optional[str] = Field(
-        None, 
-        description="Project ID currently being executed, if any",
-        example=None
-    )
-    last_check: Optional[str] = Field(
-        None, 
-        description="ISO timestamp of last scheduler check",
-        example="2026-01-09T10:30:00Z"
-    )
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "status": "healthy",
-                "runner_active": True,
-                "projects_in_queue": 5,
-                "currently_executing": None,
-                "last_check": "2026-01-09T10:30:00Z"
-            }
-        }
-    }
+    status: str = Field(..., description="Overall health status")
+    runner_active: bool = Field(..., description="Whether the scheduler is actively running")
+    projects_in_queue: int = Field(..., description="Number of projects currently in the scheduling queue")
+    currently_executing: Optional[str] = Field(None, description="Project ID currently being executed, if any")
+    last_check: Optional[str] = Field(None, description="ISO timestamp of last scheduler check")
 
 
 class RefreshResponse(BaseModel):
     """Response after refreshing the project queue."""
-    message: str = Field(..., description="Status message", example="Projects refreshed")
-    queue_size: int = Field(..., description="New queue size after refresh", example=8)
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "message": "Projects refreshed",
-                "queue_size": 8
-            }
-        }
-    }
+    message: str = Field(..., description="Status message")
+    queue_size: int = Field(..., description="New queue size after refresh")
 
 
 class CleanupResponse(BaseModel):
     """Response after cleaning up a project's temporary files."""
-    message: str = Field(
-        ..., 
-        description="Status message describing the cleanup result",
-        example="Successfully cleaned up temporary directory for project 'order-validation'"
-    )
-    cleaned: bool = Field(
-        ..., 
-        description="Whether files were actually removed",
-        example=True
-    )
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "message": "Successfully cleaned up temporary directory for project 'order-validation'",
-                "cleaned": True
-            }
-        }
-    }
+    message: str = Field(..., description="Status message describing the cleanup result")
+    cleaned: bool = Field(..., description="Whether files were actually removed")
 
 
 class RunProjectRequest(BaseModel):
     """Request body for running a project on-demand."""
-    start_date: str = Field(
-        ...,
-        description="Start date in ISO format (YYYY-MM-DD or full ISO datetime)",
-        example="2026-01-17"
-    )
-    end_date: str = Field(
-        ...,
-        description="End date in ISO format (YYYY-MM-DD or full ISO datetime)",
-        example="2026-01-17"
-    )
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "start_date": "2026-01-17",
-                "end_date": "2026-01-17"
-            }
-        }
-    }
+    # Typed as date so ISO parsing (and the 422 on malformed input)
+    # happens in pydantic-core rather than downstream Python code.
+    start_date: date = Field(..., description="Start date in ISO format (YYYY-MM-DD)")
+    end_date: date = Field(..., description="End date in ISO format (YYYY-MM-DD)")
 
 
 class RunProjectResponse(BaseModel):
     """Response after triggering a project execution."""
-    message: str = Field(
-        ...,
-        description="Status message",
-        example="Execution started for project 'order-validation'"
-    )
-    execution_id: int = Field(
-        ...,
-        description="The ID of the created execution record",
-        example=12345
-    )
-    project_id: str = Field(
-        ...,
-        description="The project that was executed",
-        example="order-validation"
-    )
-    status: str = Field(
-        ...,
-        description="Final execution status",
-        example="success"
-    )
+    message: str = Field(..., description="Status message")
+    execution_id: int = Field(..., description="The ID of the created execution record")
+    project_id: ProjectId
+    status: str = Field(..., description="Final execution status")
+
+
+# Flat enum -> wire string table; a dict hash is cheaper than the enum
+# .value descriptor access in the per-row serialization loop.
+_STATUS_STR = {s: s.value for s in ExecutionStatus}
+
+# Dedicated pool for manual project runs. These block for minutes, so
+# they get their own small pool (which also caps concurrent runs at 4)
+# rather than occupying workers in asyncio's shared to_thread pool.
+_run_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="run-project")
+
+# Fixed-shape probe payloads: one bytes interpolation instead of the
+# full pydantic-validation + JSON-encoding pipeline per request.
+_HEALTH_TMPL = (
+    b'{"status":"healthy","runner_active":%s,"projects_in_queue":%d,'
+    b'"currently_executing":%s,"last_check":%s}'
+)
+_REFRESH_TMPL = b'{"message":"Projects refreshed","queue_size":%d}'
+
+# Route responses= documentation, hoisted to module scope so the nested
+# dict/str literals are built and interned once instead of per
+# create_monitoring_api call.
+_HEALTH_RESPONSES = {
+    200: {
+        "description": "Service is healthy",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "healthy",
+                    "runner_active": True,
+                    "projects_in_queue": 5,
+                    "currently_executing": None,
+                    "last_check": "2026-01-09T10:30:00Z"
+                }
+            }
+        }
+    }
+}
+
+_STATUS_RESPONSES = {
+    200: {
+        "description": "Current runner status",
+        "content": {
+            "application/json": {
+                "example": {
+                    "is_running": True,
+                    "projects_in_queue": 5,
+                    "currently_executing": None,
+                    "total_executions": 1250,
+                    "successful_executions": 1180,
+                    "failed_executions": 70,
+                    "last_check_time": "2026-01-09T10:30:00Z"
+                }
+            }
+        }
+    }
+}
+
+_QUEUE_RESPONSES = {
+    200: {
+        "description": "List of queued projects",
+        "content": {
+            "application/json": {
+                "example": [
+                    {
+                        "project_id": "order-validation",
+                        "project_name": "Order Validation Rules",
+                        "next_run": "2026-01-09T11:00:00Z",
+                        "cron_expression": "0 * * * *",
+                        "timezone": "Europe/Istanbul"
+                    },
+                    {
+                        "project_id": "delivery-checks",
+                        "project_name": "Delivery Time Checks",
+                        "next_run": "2026-01-09T12:00:00Z",
+                        "cron_expression": "0 */2 * * *",
+                        "timezone": "UTC"
+                    }
+                ]
+            }
+        }
+    }
+}
+
+_PROJECT_STATUS_RESPONSES = {
+    200: {
+        "description": "Project status retrieved successfully",
+    },
+    404: {
+        "description": "Project not found",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Project not found"}
+            }
+        }
+    }
+}
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "message": "Execution completed for project 'order-validation'",
-                "execution_id": 12345,
-                "project_id": "order-validation",
-                "status": "success"
+_EXEC_HISTORY_RESPONSES = {
+    200: {
+        "description": "Execution history retrieved successfully",
+    }
+}
+
+_EXECUTION_RESPONSES = {
+    200: {
+        "description": "Execution details retrieved successfully",
+    },
+    404: {
+        "description": "Execution not found",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Execution not found"}
             }
         }
     }
+}
+
+_STATS_RESPONSES = {
+    200: {
+        "description": "Statistics retrieved successfully",
+        "content": {
+            "application/json": {
+                "example": {
+                    "total": 1250,
+                    "pending": 2,
+                    "running": 1,
+                    "success": 1180,
+                    "failed": 45,
+                    "cancelled": 12,
+                    "timeout": 10,
+                    "success_rate": 94.40
+                }
+            }
+        }
+    }
+}
+
+_REFRESH_RESPONSES = {
+    200: {
+        "description": "Queue refreshed successfully",
+        "content": {
+            "application/json": {
+                "example": {
+                    "message": "Projects refreshed",
+                    "queue_size": 8
+                }
+            }
+        }
+    }
+}
+
+_CLEANUP_RESPONSES = {
+    200: {
+        "description": "Cleanup completed",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "cleaned": {
+                        "summary": "Files removed",
+                        "value": {
+                            "message": "Successfully cleaned up temporary directory for project 'order-validation'",
+                            "cleaned": True
+                        }
+                    },
+                    "not_found": {
+                        "summary": "No files to clean",
+                        "value": {
+                            "message": "No temporary directory found for project 'order-validation'",
+                            "cleaned": False
+                        }
+                    }
+                }
+            }
+        }
+    },
+    400: {
+        "description": "Project is still active",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Project 'order-validation' is still active. Deactivate it first before cleanup."
+                }
+            }
+        }
+    },
+    500: {
+        "description": "Cleanup failed",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Failed to remove directory: Permission denied"
+                }
+            }
+        }
+    },
+    503: {
+        "description": "Executor not available",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Cleanup operation not available - executor not configured"
+                }
+            }
+        }
+    }
+}
+
+_RUN_RESPONSES = {
+    200: {
+        "description": "Execution completed",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "success": {
+                        "summary": "Successful execution",
+                        "value": {
+                            "message": "Execution completed for project 'order-validation'",
+                            "execution_id": 12345,
+                            "project_id": "order-validation",
+                            "status": "success"
+                        }
+                    },
+                    "discrepancies_found": {
+                        "summary": "Discrepancies found",
+                        "value": {
+                            "message": "Execution completed for project 'order-validation'",
+                            "execution_id": 12346,
+                            "project_id": "order-validation",
+                            "status": "success"
+                        }
+                    }
+                }
+            }
+        }
+    },
+    404: {
+        "description": "Project not found",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Project 'invalid-project' not found"}
+            }
+        }
+    },
+    503: {
+        "description": "Executor not available",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Run operation not available - executor not configured"}
+            }
+        }
+    }
+}
 
 
-def execution_to_response(exec: ProjectExecution) -> ExecutionResponse:
-    """Convert ProjectExecution to API response."""
-    duration = None
-    if exec.started_at and exec.finished_at:
-        duration = (exec.finished_at - exec.started_at).total_seconds()
-    
-    return ExecutionResponse(
+def execution_to_response(exec: "ProjectExecution") -> ExecutionResponse:
+    """
+    Convert ProjectExecution to API response.
+
+    Uses model_construct since the execution comes from the trusted DB
+    layer; skipping field validation is linear in the page size for the
+    history endpoint.
+    """
+    return ExecutionResponse.model_construct(
         id=exec.id,
         project_id=exec.project_id,
-        status=exec.status.value,
+        status=_STATUS_STR[exec.status],
         scheduled_for=exec.scheduled_for,
         started_at=exec.started_at,
         finished_at=exec.finished_at,
-        duration_seconds=duration,
+        duration_seconds=exec.duration_seconds,
         exit_code=exec.exit_code,
         error_message=exec.error_message,
         created_at=exec.created_at,
     )
 
 
+# Module-level adapter so pydantic-core builds one SchemaSerializer at
+# import and dump_json emits bytes directly, with no per-request
+# serializer setup or str -> bytes round trip.
+_EXEC_ADAPTER = TypeAdapter(ExecutionResponse)
+
+
+def _encode_ndjson(executions) -> Iterator[bytes]:
+    """
+    Serialize executions incrementally as newline-delimited JSON.
+
+    One row is encoded and flushed at a time, so peak memory stays
+    constant regardless of the requested page size.
+    """
+    for execution in executions:
+        yield _EXEC_ADAPTER.dump_json(execution_to_response(execution)) + b"\n"
+
+
+@lru_cache(maxsize=1)
 def create_monitoring_api(
-    db_client: DatabaseClient,
-    scheduler: ProjectScheduler,
+    db_client: "DatabaseClient",
+    scheduler: "ProjectScheduler",
     lifespan=None,
     executor=None,
     version: str = "1.0.0",
 ) -> FastAPI:
     """
     Create the monitoring FastAPI application.
-    
+
+    Memoized on argument identity: repeated calls with the same
+    components (worker respawns, tests) reuse the built app instead of
+    re-running pydantic schema generation and route registration. A new
+    db_client/scheduler instance naturally yields a fresh app.
+
     Args:
         db_client: Database client instance
         scheduler: Project scheduler instance
         lifespan: Optional lifespan context manager
         executor: Optional project executor instance for cleanup operations
-        
+
     Returns:
         Configured FastAPI application
     """
@@ -480,11 +527,26 @@ Cricket is a cron-based scheduler that dynamically synthesizes and executes disc
         ],
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
     )
 
+    # Probe endpoints are hit by liveness/readiness checks at high
+    # frequency; memoizing on a 500ms monotonic bucket collapses probe
+    # stampedes to one scheduler/DB hit per interval.
+    @lru_cache(maxsize=1)
+    def _cached_status(bucket: int):
+        return scheduler.get_status()
+
+    @lru_cache(maxsize=1)
+    def _cached_stats(bucket: int):
+        return db_client.get_execution_stats()
+
+    def _probe_bucket() -> int:
+        return int(time.monotonic() * 2)
+
     @app.get(
         "/health",
-        response_model=HealthResponse,
+        response_model=None,
         tags=["Health"],
         summary="Health check",
         description="""
@@ -498,37 +560,23 @@ Returns the current state of the scheduler including:
 - Current execution status
 - Last scheduler check timestamp
         """,
-        responses={
-            200: {
-                "description": "Service is healthy",
-                "content": {
-                    "application/json": {
-                        "example": {
-                            "status": "healthy",
-                            "runner_active": True,
-                            "projects_in_queue": 5,
-                            "currently_executing": None,
-                            "last_check": "2026-01-09T10:30:00Z"
-                        }
-                    }
-                }
-            }
-        }
+        responses=_HEALTH_RESPONSES
     )
     def health():
         """Health check endpoint."""
-        status = scheduler.get_status()
-        return {
-            "status": "healthy",
-            "runner_active": status.is_running,
-            "projects_in_queue": status.projects_in_queue,
-            "currently_executing": status.currently_executing,
-            "last_check": status.last_check_time.isoformat() if status.last_check_time else None,
-        }
+        status = _cached_status(_probe_bucket())
+        last_check = status.last_check_time.isoformat() if status.last_check_time else None
+        payload = _HEALTH_TMPL % (
+            b"true" if status.is_running else b"false",
+            status.projects_in_queue,
+            orjson.dumps(status.currently_executing),
+            orjson.dumps(last_check),
+        )
+        return Response(content=payload, media_type="application/json")
 
     @app.get(
         "/status",
-        response_model=RunnerStatus,
+        response_model=None,
         tags=["Health"],
         summary="Get runner status",
         description="""
@@ -540,32 +588,15 @@ Provides detailed information about:
 - Cumulative execution counts (total, successful, failed)
 - Last check timestamp
         """,
-        responses={
-            200: {
-                "description": "Current runner status",
-                "content": {
-                    "application/json": {
-                        "example": {
-                            "is_running": True,
-                            "projects_in_queue": 5,
-                            "currently_executing": None,
-                            "total_executions": 1250,
-                            "successful_executions": 1180,
-                            "failed_executions": 70,
-                            "last_check_time": "2026-01-09T10:30:00Z"
-                        }
-                    }
-                }
-            }
-        }
+        responses=_STATUS_RESPONSES
     )
     def get_runner_status():
         """Get the overall runner status."""
-        return scheduler.get_status()
+        return _cached_status(_probe_bucket())
 
     @app.get(
         "/queue",
-        response_model=List[QueueItemResponse],
+        response_model=None,
         tags=["Queue"],
         summary="Get scheduling queue",
         description="""
@@ -577,49 +608,24 @@ Each item includes:
 - Next scheduled run time
 - Cron expression and timezone
         """,
-        responses={
-            200: {
-                "description": "List of queued projects",
-                "content": {
-                    "application/json": {
-                        "example": [
-                            {
-                                "project_id": "order-validation",
-                                "project_name": "Order Validation Rules",
-                                "next_run": "2026-01-09T11:00:00Z",
-                                "cron_expression": "0 * * * *",
-                                "timezone": "Europe/Istanbul"
-                            },
-                            {
-                                "project_id": "delivery-checks",
-                                "project_name": "Delivery Time Checks",
-                                "next_run": "2026-01-09T12:00:00Z",
-                                "cron_expression": "0 */2 * * *",
-                                "timezone": "UTC"
-                            }
-                        ]
-                    }
-                }
-            }
-        }
+        responses=_QUEUE_RESPONSES
     )
-    def get_queue():
+    def get_queue(
+        limit: Optional[int] = Query(
+            None,
+            ge=1,
+            description="Return only the next N projects by run time"
+        )
+    ):
         """Get the current scheduling queue."""
-        queue_items = scheduler.get_queue_status()
-        return [
-            QueueItemResponse(
-                project_id=item["project_id"],
-                project_name=item["project_name"],
-                next_run=datetime.fromisoformat(item["next_run"]),
-                cron_expression=item["cron_expression"],
-                timezone=item["timezone"],
-            )
-            for item in queue_items
-        ]
+        # The scheduler already returns the response shape with next_run
+        # as an ISO string; forwarding it untouched skips a parse +
+        # re-format round-trip per item.
+        return scheduler.get_queue_status(limit=limit)
 
     @app.get(
         "/projects/{project_id}",
-        response_model=ProjectStatusResponse,
+        response_model=None,
         tags=["Projects"],
         summary="Get project status",
         description="""
@@ -632,21 +638,9 @@ Returns:
 - Cron expression and timezone
 - Most recent execution details
         """,
-        responses={
-            200: {
-                "description": "Project status retrieved successfully",
-            },
-            404: {
-                "description": "Project not found",
-                "content": {
-                    "application/json": {
-                        "example": {"detail": "Project not found"}
-                    }
-                }
-            }
-        }
+        responses=_PROJECT_STATUS_RESPONSES
     )
-    def get_project_status(
+    async def get_project_status(
         project_id: str = Path(
             ...,
             description="Unique project identifier",
@@ -654,20 +648,19 @@ Returns:
         )
     ):
         """Get status for a specific project."""
-        # Check if project is in the queue
-        queue_items = scheduler.get_queue_status()
-        queue_item = next(
-            (item for item in queue_items if item["project_id"] == project_id),
-            None
+        # The queue lookup and the last-execution query are independent;
+        # overlapping them hides the DB roundtrip behind the queue read.
+        queue_item, executions = await asyncio.gather(
+            asyncio.to_thread(scheduler.get_queue_item, project_id),
+            asyncio.to_thread(db_client.get_project_executions, project_id, limit=1),
         )
-        
+        last_exec = executions[0] if executions else None
+
         if not queue_item:
             # Project might exist but not be scheduled
-            executions = db_client.get_project_executions(project_id, limit=1)
             if not executions:
                 raise HTTPException(status_code=404, detail="Project not found")
-            
-            last_exec = executions[0] if executions else None
+
             return ProjectStatusResponse(
                 project_id=project_id,
                 project_name="Unknown",
@@ -676,16 +669,14 @@ Returns:
                 timezone="UTC",
                 last_execution=execution_to_response(last_exec) if last_exec else None,
             )
-        
-        # Get last execution
-        executions = db_client.get_project_executions(project_id, limit=1)
-        last_exec = executions[0] if executions else None
-        
+
         return ProjectStatusResponse(
             project_id=project_id,
             project_name=queue_item["project_name"],
             is_scheduled=True,
-            next_run=datetime.fromisoformat(queue_item["next_run"]),
+            # ISO string from the scheduler; pydantic-core parses it on
+            # the Rust side, so no Python-level fromisoformat here.
+            next_run=queue_item["next_run"],
             cron_expression=queue_item["cron_expression"],
             timezone=queue_item["timezone"],
             last_execution=execution_to_response(last_exec) if last_exec else None,
@@ -693,14 +684,15 @@ Returns:
 
     @app.get(
         "/projects/{project_id}/executions",
-        response_model=List[ExecutionResponse],
+        response_model=None,
         tags=["Executions"],
         summary="Get project execution history",
         description="""
 Retrieve the execution history for a specific project.
 
-Returns a list of executions ordered by most recent first.
-Use the `limit` parameter to control how many records to retrieve.
+Returns executions as newline-delimited JSON (one record per line),
+ordered by most recent first. Use the `limit` parameter to control how
+many records to retrieve.
 
 Each execution includes:
 - Timing information (scheduled, started, finished)
@@ -708,11 +700,7 @@ Each execution includes:
 - Duration calculation
 - Error message if failed
         """,
-        responses={
-            200: {
-                "description": "Execution history retrieved successfully",
-            }
-        }
+        responses=_EXEC_HISTORY_RESPONSES
     )
     def get_project_executions(
         project_id: str = Path(
@@ -728,12 +716,15 @@ Each execution includes:
         )
     ):
         """Get execution history for a project."""
-        executions = db_client.get_project_executions(project_id, limit=limit)
-        return [execution_to_response(e) for e in executions]
+        rows = db_client.iter_project_executions(project_id, limit=limit)
+        return StreamingResponse(
+            _encode_ndjson(rows),
+            media_type="application/x-ndjson",
+        )
 
     @app.get(
         "/executions/{execution_id}",
-        response_model=ExecutionResponse,
+        response_model=None,
         tags=["Executions"],
         summary="Get execution details",
         description="""
@@ -744,19 +735,7 @@ Returns complete execution information including:
 - Exit code and duration
 - Error message if applicable
         """,
-        responses={
-            200: {
-                "description": "Execution details retrieved successfully",
-            },
-            404: {
-                "description": "Execution not found",
-                "content": {
-                    "application/json": {
-                        "example": {"detail": "Execution not found"}
-                    }
-                }
-            }
-        }
+        responses=_EXECUTION_RESPONSES
     )
     def get_execution(
         execution_id: int = Path(
@@ -774,7 +753,7 @@ Returns complete execution information including:
 
     @app.get(
         "/stats",
-        response_model=StatsResponse,
+        response_model=None,
         tags=["Statistics"],
         summary="Get execution statistics",
         description="""
@@ -785,48 +764,46 @@ Provides:
 - Breakdown by status (pending, running, success, failed, cancelled, timeout)
 - Overall success rate percentage
         """,
-        responses={
-            200: {
-                "description": "Statistics retrieved successfully",
-                "content": {
-                    "application/json": {
-                        "example": {
-                            "total": 1250,
-                            "pending": 2,
-                            "running": 1,
-                            "success": 1180,
-                            "failed": 45,
-                            "cancelled": 12,
-                            "timeout": 10,
-                            "success_rate": 94.40
-                        }
-                    }
-                }
-            }
-        }
+        responses=_STATS_RESPONSES
     )
     def get_stats():
         """Get execution statistics."""
-        stats = db_client.get_execution_stats()
-        
-        total = sum(stats.values())
-        success = stats.get("success", 0)
-        success_rate = (success / total * 100) if total > 0 else 0.0
-        
-        return StatsResponse(
+        stats = _cached_stats(_probe_bucket())
+
+        # Single pass over the counts instead of a sum() plus one .get()
+        # per status; the values come from the DB layer so the response
+        # is built without re-validation. Statuses outside the known set
+        # (legacy rows, newer deployments) still count toward the total
+        # but get no bucket of their own.
+        total = 0
+        counts = {
+            "pending": 0,
+            "running": 0,
+            "success": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "timeout": 0,
+        }
+        for key, value in stats.items():
+            total += value
+            if key in counts:
+                counts[key] = value
+
+        success = counts["success"]
+        return StatsResponse.model_construct(
             total=total,
-            pending=stats.get("pending", 0),
-            running=stats.get("running", 0),
+            pending=counts["pending"],
+            running=counts["running"],
             success=success,
-            failed=stats.get("failed", 0),
-            cancelled=stats.get("cancelled", 0),
-            timeout=stats.get("timeout", 0),
-            success_rate=round(success_rate, 2),
+            failed=counts["failed"],
+            cancelled=counts["cancelled"],
+            timeout=counts["timeout"],
+            success_rate=round(success * 100.0 / total, 2) if total else 0.0,
         )
 
     @app.post(
         "/projects/refresh",
-        response_model=RefreshResponse,
+        response_model=None,
         tags=["Queue"],
         summary="Refresh project queue",
         description="""
@@ -844,31 +821,17 @@ Use this endpoint after:
 
 **Note:** Existing projects preserve their current next_run time; only new projects get recalculated.
         """,
-        responses={
-            200: {
-                "description": "Queue refreshed successfully",
-                "content": {
-                    "application/json": {
-                        "example": {
-                            "message": "Projects refreshed",
-                            "queue_size": 8
-                        }
-                    }
-                }
-            }
-        }
+        responses=_REFRESH_RESPONSES
     )
     def refresh_projects():
         """Trigger a refresh of the project queue from the database."""
         scheduler.refresh_projects()
-        return RefreshResponse(
-            message="Projects refreshed",
-            queue_size=scheduler.get_status().projects_in_queue
-        )
+        payload = _REFRESH_TMPL % scheduler.get_status().projects_in_queue
+        return Response(content=payload, media_type="application/json")
 
     @app.delete(
         "/projects/{project_id}/cleanup",
-        response_model=CleanupResponse,
+        response_model=None,
         tags=["Projects"],
         summary="Clean up project files",
         description="""
@@ -888,63 +851,9 @@ This operation:
 - When reclaiming disk space
 - Before removing a project from the database
         """,
-        responses={
-            200: {
-                "description": "Cleanup completed",
-                "content": {
-                    "application/json": {
-                        "examples": {
-                            "cleaned": {
-                                "summary": "Files removed",
-                                "value": {
-                                    "message": "Successfully cleaned up temporary directory for project 'order-validation'",
-                                    "cleaned": True
-                                }
-                            },
-                            "not_found": {
-                                "summary": "No files to clean",
-                                "value": {
-                                    "message": "No temporary directory found for project 'order-validation'",
-                                    "cleaned": False
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            400: {
-                "description": "Project is still active",
-                "content": {
-                    "application/json": {
-                        "example": {
-                            "detail": "Project 'order-validation' is still active. Deactivate it first before cleanup."
-                        }
-                    }
-                }
-            },
-            500: {
-                "description": "Cleanup failed",
-                "content": {
-                    "application/json": {
-                        "example": {
-                            "detail": "Failed to remove directory: Permission denied"
-                        }
-                    }
-                }
-            },
-            503: {
-                "description": "Executor not available",
-                "content": {
-                    "application/json": {
-                        "example": {
-                            "detail": "Cleanup operation not available - executor not configured"
-                        }
-                    }
-                }
-            }
-        }
+        responses=_CLEANUP_RESPONSES
     )
-    def cleanup_project(
+    async def cleanup_project(
         project_id: str = Path(
             ...,
             description="Unique project identifier to clean up",
@@ -953,7 +862,7 @@ This operation:
     ):
         """
         Clean up the temporary directory of an inactive project.
-        
+
         This removes the generated code directory for the specified project.
         Should be called when a project is deactivated to free up disk space.
         """
@@ -962,26 +871,23 @@ This operation:
                 status_code=503,
                 detail="Cleanup operation not available - executor not configured"
             )
-        
-        # Check if project is in the active queue
-        queue_items = scheduler.get_queue_status()
-        is_active = any(item["project_id"] == project_id for item in queue_items)
-        
-        if is_active:
+
+        # Membership is a single dict probe, so check it inline; only the
+        # directory stat needs to leave the event loop.
+        if scheduler.contains(project_id):
             raise HTTPException(
                 status_code=400,
                 detail=f"Project '{project_id}' is still active. Deactivate it first before cleanup."
             )
-        
-        # Check if directory exists
-        if not executor.project_dir_exists(project_id):
+
+        if not await asyncio.to_thread(executor.project_dir_exists, project_id):
             return CleanupResponse(
                 message=f"No temporary directory found for project '{project_id}'",
                 cleaned=False
             )
-        
+
         try:
-            executor.cleanup_project(project_id)
+            await asyncio.to_thread(executor.cleanup_project, project_id)
             return CleanupResponse(
                 message=f"Successfully cleaned up temporary directory for project '{project_id}'",
                 cleaned=True
@@ -991,7 +897,7 @@ This operation:
 
     @app.post(
         "/projects/{project_id}/run",
-        response_model=RunProjectResponse,
+        response_model=None,
         tags=["Projects"],
         summary="Run project on-demand",
         description="""
@@ -1012,53 +918,9 @@ The execution will:
 4. Send callback notification (if configured)
 5. Record execution in the database
         """,
-        responses={
-            200: {
-                "description": "Execution completed",
-                "content": {
-                    "application/json": {
-                        "examples": {
-                            "success": {
-                                "summary": "Successful execution",
-                                "value": {
-                                    "message": "Execution completed for project 'order-validation'",
-                                    "execution_id": 12345,
-                                    "project_id": "order-validation",
-                                    "status": "success"
-                                }
-                            },
-                            "discrepancies_found": {
-                                "summary": "Discrepancies found",
-                                "value": {
-                                    "message": "Execution completed for project 'order-validation'",
-                                    "execution_id": 12346,
-                                    "project_id": "order-validation",
-                                    "status": "success"
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            404: {
-                "description": "Project not found",
-                "content": {
-                    "application/json": {
-                        "example": {"detail": "Project 'invalid-project' not found"}
-                    }
-                }
-            },
-            503: {
-                "description": "Executor not available",
-                "content": {
-                    "application/json": {
-                        "example": {"detail": "Run operation not available - executor not configured"}
-                    }
-                }
-            }
-        }
+        responses=_RUN_RESPONSES
     )
-    def run_project(
+    async def run_project(
         project_id: str = Path(
             ...,
             description="Unique project identifier to execute",
@@ -1068,7 +930,7 @@ The execution will:
     ):
         """
         Run a project on-demand with specified date range.
-        
+
         This executes the project immediately without waiting for the scheduler.
         The execution is synchronous and will block until complete.
         """
@@ -1077,20 +939,28 @@ The execution will:
                 status_code=503,
                 detail="Run operation not available - executor not configured"
             )
-        
-        # Check if project exists
-        project = db_client.get_project(project_id)
+
+        # Check if project exists (cached; only gates the run, so a few
+        # seconds of staleness is fine)
+        project = await asyncio.to_thread(db_client.get_project_cached, project_id)
         if not project:
             raise HTTPException(
                 status_code=404,
                 detail=f"Project '{project_id}' not found"
             )
-        
-        # Execute the project
-        execution = executor.execute_standalone(
-            project_id=project_id,
-            start_date=request.start_date,
-            end_date=request.end_date,
+
+        # Execute the project on the dedicated run pool: the run takes
+        # minutes, and parking it on asyncio's shared thread pool would
+        # pin one of the default workers that every other to_thread call
+        # in the app competes for.
+        execution = await asyncio.get_running_loop().run_in_executor(
+            _run_pool,
+            partial(
+                executor.execute_standalone,
+                project_id=project_id,
+                start_date=request.start_date.isoformat(),
+                end_date=request.end_date.isoformat(),
+            ),
         )
         
         return RunProjectResponse(
@@ -1100,4 +970,18 @@ The execution will:
             status=execution.status.value,
         )
 
+    # The built-in /openapi.json handler re-encodes the schema dict on
+    # every request. Serialize it to bytes once at startup and serve the
+    # frozen payload instead; the built-in route must be dropped first
+    # because Starlette matches routes in registration order.
+    app.router.routes = [
+        route for route in app.router.routes
+        if getattr(route, "path", None) != app.openapi_url
+    ]
+    schema_bytes = orjson.dumps(app.openapi())
+
+    @app.get(app.openapi_url, include_in_schema=False)
+    def serve_openapi():
+        return Response(content=schema_bytes, media_type="application/json")
+
     return app
@@ -1,12 +1,14 @@
 """
 CDN configuration models for report uploads.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CdnConfig(BaseModel):
     """Configuration for CDN/S3-compatible storage uploads using boto3."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     cdn_url: str = Field(
         ...,
         description="S3-compatible endpoint URL (e.g., Cloudflare R2 endpoint)",
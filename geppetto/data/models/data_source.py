@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, SecretStr
 from typing import Literal, Union
 from enum import Enum
 
@@ -9,7 +9,11 @@ class DataSourceType(str, Enum):
     MANUAL = "manual"  # User uploads data via API
 
 
+# Data-source configs are read-only once parsed; frozen models skip the
+# __setattr__ machinery and validate slightly faster.
 class SqlConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: Literal[DataSourceType.SQL] = DataSourceType.SQL
     connection_string: str = Field(
         ..., description="SQL database connection string", min_length=1
@@ -25,6 +29,8 @@ class SqlConfig(BaseModel):
 
 
 class ApiConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: Literal[DataSourceType.API] = DataSourceType.API.value
     api_url: str = Field(..., description="API endpoint URL", min_length=1)
     api_page_size: int = Field(
@@ -33,19 +39,23 @@ class ApiConfig(BaseModel):
     auth_token: str | None = Field(
         default=None, description="Optional static authentication token"
     )
-    # Login credentials for dynamic token fetching
+    # Login credentials for dynamic token fetching. No baked-in
+    # defaults: credentials come from the project config or from the
+    # FRINK_LOGIN_* environment variables at synthesis time.
     login_url: str | None = Field(
-        default="https://api.frink.com.tr/api/panel/auth/login", description="Login endpoint URL for fetching access token"
+        default=None, description="Login endpoint URL for fetching access token"
     )
-    login_email: str | None = Field(
-        default="harun.uz@loodos.com", description="Email for login authentication"
+    login_email: SecretStr | None = Field(
+        default=None, description="Email for login authentication"
     )
-    login_password: str | None = Field(
-        default="I19Ws3", description="Password for login authentication"
+    login_password: SecretStr | None = Field(
+        default=None, description="Password for login authentication"
     )
 
 
 class ManualConfig(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: Literal[DataSourceType.MANUAL] = DataSourceType.MANUAL
     # No additional config needed - data comes via API
 
@@ -4,7 +4,7 @@ Models for project scheduling and execution tracking.
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ExecutionStatus(str, Enum):
@@ -19,6 +19,11 @@ class ExecutionStatus(str, Enum):
 
 class ProjectSchedule(BaseModel):
     """Project schedule configuration from the database."""
+    # DB snapshots are never mutated in place; frozen models skip the
+    # __setattr__ hook. ScheduledProject and RunnerStatus stay mutable —
+    # the scheduler reassigns/increments their fields.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: int
     project_id: str
     cron_expression: str
@@ -30,6 +35,8 @@ class ProjectSchedule(BaseModel):
 
 class ProjectConfig(BaseModel):
     """Project configuration loaded from the database."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     name: str
     config: Dict[str, Any]  # Contains data_source config and other settings
@@ -40,6 +47,8 @@ class ProjectConfig(BaseModel):
 
 class ProjectExecution(BaseModel):
     """Execution record for a project run."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: Optional[int] = None
     project_id: str
     status: ExecutionStatus
@@ -49,6 +58,9 @@ class ProjectExecution(BaseModel):
     exit_code: Optional[int] = None
     error_message: Optional[str] = None
     created_at: Optional[datetime] = None
+    # Computed in SQL (EXTRACT(EPOCH FROM finished_at - started_at)) so
+    # no per-row timedelta arithmetic is needed in Python.
+    duration_seconds: Optional[float] = None
 
 
 class ScheduledProject(BaseModel):
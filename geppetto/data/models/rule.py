@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Severity(str, Enum):
@@ -17,6 +17,8 @@ class RuleDefinition(BaseModel):
     This represents a concrete rule concept before it's translated into code.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: int = Field(
         ..., description="Versioned numeric identifier (display_id * 1000 + version)"
     )
@@ -55,6 +57,8 @@ class RuleDefinition(BaseModel):
 
 
 class DiscrepancyRule(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     rule_id: str = Field(
         ..., description="Unique snake_case identifier (e.g., 'late_delivery_check')."
     )
@@ -2,11 +2,16 @@
 Database client for the runner manager.
 Handles all database operations for projects, schedules, rules, and executions.
 """
-import json
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 
-import psycopg
+import orjson
+from psycopg import Cursor
+from psycopg.types.json import set_json_loads
+from psycopg_pool import ConnectionPool
 
 from geppetto.data.models.execution import (
     ExecutionStatus,
@@ -16,27 +21,22 @@ from geppetto.data.models.execution import (
 from geppetto.data.models.rule import DiscrepancyRule, Severity
 
 
-class DatabaseClient:
-    """Database client for runner manager operations."""
+# Decode json/jsonb columns with orjson instead of the stdlib parser;
+# rows then always arrive as dicts/lists, never as raw JSON text.
+set_json_loads(orjson.loads)
 
-    def __init__(self, connection_string: str):
-        self.connection_string = connection_string
 
-    def _get_connection(self) -> psycopg.Connection:
-        """Create a new database connection."""
-        return psycopg.connect(self.connection_string)
+# Query text hoisted to module constants and executed with prepare=True:
+# after a few runs psycopg promotes each to a server-side prepared
+# statement, so Postgres skips parse/plan on the hot scheduler paths and
+# Python reuses one interned string per query.
+_EXEC_COLUMNS = """
+                id, project_id, status, scheduled_for,
+                started_at, finished_at, exit_code, error_message, created_at,
+                EXTRACT(EPOCH FROM finished_at - started_at)::float8 AS duration_seconds
+"""
 
-    def fetch_active_projects(self, limit: int = 10) -> List[ProjectConfig]:
-        """
-        Fetch active projects with their schedule configurations.
-        
-        Args:
-            limit: Maximum number of projects to fetch
-            
-        Returns:
-            List of ProjectConfig objects
-        """
-        query = """
+_Q_ACTIVE_PROJECTS = """
             SELECT
                 p.id,
                 p.name,
@@ -49,41 +49,9 @@ class DatabaseClient:
                 ON s.project_id = p.id
             WHERE p.is_active = TRUE
             LIMIT %s
-        """
-        
-        projects = []
-        with self._get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query, (limit,))
-                rows = cur.fetchall()
-                
-                for row in rows:
-                    config = row[2]
-                    if isinstance(config, str):
-                        config = json.loads(config)
-                    
-                    projects.append(ProjectConfig(
-                        id=row[0],
-                        name=row[1],
-                        config=config,
-                        cron_expression=row[3],
-                        timezone=row[4],
-                        allow_concurrent=row[5],
-                    ))
-        
-        return projects
+"""
 
-    def get_project(self, project_id: str) -> Optional[ProjectConfig]:
-        """
-        Fetch a single project by ID.
-        
-        Args:
-            project_id: The project identifier
-            
-        Returns:
-            ProjectConfig if found, None otherwise
-        """
-        query = """
+_Q_GET_PROJECT = """
             SELECT
                 p.id,
                 p.name,
@@ -95,40 +63,15 @@ class DatabaseClient:
             JOIN project_schedules s
                 ON s.project_id = p.id
             WHERE p.id = %s
-        """
-        
-        with self._get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query, (project_id,))
-                row = cur.fetchone()
-                
-                if not row:
-                    return None
-                
-                config = row[2]
-                if isinstance(config, str):
-                    config = json.loads(config)
-                
-                return ProjectConfig(
-                    id=row[0],
-                    name=row[1],
-                    config=config,
-                    cron_expression=row[3],
-                    timezone=row[4],
-                    allow_concurrent=row[5],
-                )
+"""
 
-    def fetch_project_rules(self, project_id: str) -> List[DiscrepancyRule]:
-        """
-        Fetch all discrepancy rules for a specific project.
-        
-        Args:
-            project_id: The project identifier
-            
-        Returns:
-            List of DiscrepancyRule objects
-        """
-        query = """
+# Same row shape as _Q_GET_PROJECT, restricted to active projects: the
+# scheduler's between-refresh re-validation must see a deactivated
+# project the same way a full refresh would (absent), not keep running
+# it until the next refresh.
+_Q_GET_ACTIVE_PROJECT = f"{_Q_GET_PROJECT}            AND p.is_active = TRUE\n"
+
+_Q_PROJECT_RULES = """
             SELECT
                 rule_id,
                 rule_display_name,
@@ -145,70 +88,468 @@ class DatabaseClient:
                 is_rejected
             FROM discrepancy_rules
             WHERE project_id = %s AND is_rejected = FALSE
+"""
+
+_Q_CREATE_EXECUTION = """
+            INSERT INTO project_executions (project_id, status, scheduled_for)
+            VALUES (%s, %s, %s)
+            RETURNING id
+"""
+
+# Existence check folded into the INSERT: no row is created (and no
+# separate SELECT round trip is needed) when the project is unknown.
+_Q_CREATE_EXECUTION_IF_PROJECT = """
+            INSERT INTO project_executions (project_id, status, scheduled_for)
+            SELECT %s, %s, %s
+            WHERE EXISTS (SELECT 1 FROM projects WHERE id = %s)
+            RETURNING id
+"""
+
+# PENDING insert and RUNNING update collapsed into one statement: the
+# two always happen back to back, so one round trip suffices.
+_Q_CREATE_AND_START_EXECUTION = """
+            INSERT INTO project_executions (project_id, status, scheduled_for, started_at)
+            VALUES (%s, 'running', %s, NOW())
+            RETURNING id
+"""
+
+# Fixed column list with COALESCE instead of a dynamically assembled SET
+# clause: one statement shape means one reusable server-side plan.
+_Q_UPDATE_EXECUTION = """
+            UPDATE project_executions
+            SET
+                status = %s,
+                started_at = COALESCE(%s, started_at),
+                finished_at = COALESCE(%s, finished_at),
+                exit_code = COALESCE(%s, exit_code),
+                error_message = COALESCE(%s, error_message)
+            WHERE id = %s
+"""
+
+_Q_UPDATE_EXECUTION_RETURNING = f"""
+            {_Q_UPDATE_EXECUTION}
+            RETURNING {_EXEC_COLUMNS}
+"""
+
+_Q_GET_EXECUTION = f"""
+            SELECT {_EXEC_COLUMNS}
+            FROM project_executions
+            WHERE id = %s
+"""
+
+_Q_PROJECT_EXECUTIONS = f"""
+            SELECT {_EXEC_COLUMNS}
+            FROM project_executions
+            WHERE project_id = %s
+            ORDER BY created_at DESC
+            LIMIT %s
+"""
+
+_Q_RUNNING_EXECUTION = f"""
+            SELECT {_EXEC_COLUMNS}
+            FROM project_executions
+            WHERE project_id = %s AND status = 'running'
+            LIMIT 1
+"""
+
+_Q_EXECUTION_STATS = """
+            SELECT status, COUNT(*) as count
+            FROM project_executions
+            GROUP BY status
+"""
+
+
+# Row -> model conversion tables. These rows were written by this
+# service, so model_construct skips pydantic validation, and the lookup
+# tables replace the enum constructors' per-call value scan.
+_EXEC_COLS = (
+    "id", "project_id", "status", "scheduled_for",
+    "started_at", "finished_at", "exit_code", "error_message",
+    "created_at", "duration_seconds",
+)
+_STATUS_FROM_STR = {s.value: s for s in ExecutionStatus}
+_STATUS_VALUE = {s: s.value for s in ExecutionStatus}
+_SEVERITY_FROM_STR = {s.value: s for s in Severity}
+
+# Zero-filled stats template, built once instead of per call.
+_ZERO_STATS = {s.value: 0 for s in ExecutionStatus}
+
+# TTL for the cached project-config/rules lookups below.
+_CONFIG_CACHE_TTL_S = 30
+
+# TTL for the cached active-projects list. Deliberately short: it only
+# needs to absorb back-to-back fetches (bootstrap's load-then-refresh,
+# refresh bursts), not serve as a freshness window.
+_ACTIVE_PROJECTS_CACHE_TTL_S = 2
+
+
+def _execution_from_row(row: tuple) -> ProjectExecution:
+    """Build a ProjectExecution from a _EXEC_COLUMNS row without validation."""
+    values = dict(zip(_EXEC_COLS, row))
+    values["status"] = _STATUS_FROM_STR[values["status"]]
+    return ProjectExecution.model_construct(**values)
+
+
+class DatabaseClient:
+    """Database client for runner manager operations."""
+
+    def __init__(self, connection_string: str):
+        self.connection_string = connection_string
+        # All queries here are tiny, so the TCP + auth handshake of a
+        # fresh connection dominates their cost; a pool of warm
+        # connections pays it once per connection instead of per call.
+        self.pool = ConnectionPool(
+            connection_string,
+            min_size=2,
+            max_size=10,
+        )
+
+    def close(self) -> None:
+        """Close the connection pool and all pooled connections."""
+        self.pool.close()
+
+    @contextmanager
+    def cursor(self) -> Iterator[Cursor]:
+        """
+        Yield a cursor on a pooled connection.
+
+        Callers that make several client calls back to back can open one
+        cursor here and pass it to each call via ``cur=``, reusing a
+        single pooled connection instead of checking one out per call.
         """
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                yield cur
+
+    @contextmanager
+    def _cursor(self, cur: Optional[Cursor]) -> Iterator[Cursor]:
+        """Yield the supplied cursor, or a fresh pooled one when None."""
+        if cur is not None:
+            yield cur
+            return
+        with self.pool.connection() as conn:
+            with conn.cursor() as owned:
+                yield owned
+
+    def fetch_active_projects(self, limit: int = 10) -> List[ProjectConfig]:
+        """
+        Fetch active projects with their schedule configurations.
         
-        rules = []
-        with self._get_connection() as conn:
+        Args:
+            limit: Maximum number of projects to fetch
+            
+        Returns:
+            List of ProjectConfig objects
+        """
+        projects = []
+        with self.pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (project_id,))
-                rows = cur.fetchall()
-                
-                for row in rows:
-                    parameters = row[9]
-                    if isinstance(parameters, str):
-                        parameters = json.loads(parameters)
-                    
-                    dependencies = row[10]
-                    if isinstance(dependencies, str):
-                        dependencies = json.loads(dependencies)
-                    
-                    rules.append(DiscrepancyRule(
-                        rule_id=row[0],
-                        rule_display_name=row[1],
-                        definition_id=row[2],
-                        description=row[3],
-                        category=row[4],
-                        severity=Severity(row[5]),
-                        logic=row[6],
-                        code=row[7],
-                        explanation=row[8],
-                        parameters=parameters or {},
-                        dependencies=dependencies or [],
-                        is_approved=row[11],
-                        is_rejected=row[12],
+                cur.execute(_Q_ACTIVE_PROJECTS, (limit,), prepare=True, binary=True)
+
+                # Iterate the cursor directly: rows are consumed as they
+                # arrive instead of being buffered in a second list.
+                for row in cur:
+                    projects.append(ProjectConfig.model_construct(
+                        id=row[0],
+                        name=row[1],
+                        config=row[2],
+                        cron_expression=row[3],
+                        timezone=row[4],
+                        allow_concurrent=row[5],
                     ))
         
+        return projects
+
+    def get_project(
+        self, project_id: str, cur: Optional[Cursor] = None
+    ) -> Optional[ProjectConfig]:
+        """
+        Fetch a single project by ID.
+
+        Args:
+            project_id: The project identifier
+            cur: Optional cursor to reuse (see cursor())
+
+        Returns:
+            ProjectConfig if found, None otherwise
+        """
+        with self._cursor(cur) as cur:
+            cur.execute(_Q_GET_PROJECT, (project_id,), prepare=True)
+            row = cur.fetchone()
+
+            if not row:
+                return None
+
+            return ProjectConfig.model_construct(
+                id=row[0],
+                name=row[1],
+                config=row[2],
+                cron_expression=row[3],
+                timezone=row[4],
+                allow_concurrent=row[5],
+            )
+
+    def get_active_project(
+        self, project_id: str, cur: Optional[Cursor] = None
+    ) -> Optional[ProjectConfig]:
+        """
+        Fetch a single project by ID, only if it is active.
+
+        Unlike get_project, a project with is_active = FALSE is treated
+        as absent — use this wherever "missing" and "deactivated" must
+        behave the same, such as pre-execution checks.
+
+        Args:
+            project_id: The project identifier
+            cur: Optional cursor to reuse (see cursor())
+
+        Returns:
+            ProjectConfig if found and active, None otherwise
+        """
+        with self._cursor(cur) as cur:
+            cur.execute(_Q_GET_ACTIVE_PROJECT, (project_id,), prepare=True)
+            row = cur.fetchone()
+
+            if not row:
+                return None
+
+            return ProjectConfig.model_construct(
+                id=row[0],
+                name=row[1],
+                config=row[2],
+                cron_expression=row[3],
+                timezone=row[4],
+                allow_concurrent=row[5],
+            )
+
+    def fetch_project_rules(
+        self, project_id: str, cur: Optional[Cursor] = None
+    ) -> List[DiscrepancyRule]:
+        """
+        Fetch all discrepancy rules for a specific project.
+
+        Args:
+            project_id: The project identifier
+            cur: Optional cursor to reuse (see cursor())
+
+        Returns:
+            List of DiscrepancyRule objects
+        """
+        rules = []
+        with self._cursor(cur) as cur:
+            # binary=True switches to the binary wire format, so psycopg
+            # decodes the many text/jsonb columns in C instead of going
+            # through the text-format adapters per field.
+            cur.execute(_Q_PROJECT_RULES, (project_id,), prepare=True, binary=True)
+
+            for row in cur:
+                rules.append(DiscrepancyRule.model_construct(
+                    rule_id=row[0],
+                    rule_display_name=row[1],
+                    definition_id=row[2],
+                    description=row[3],
+                    category=row[4],
+                    severity=_SEVERITY_FROM_STR[row[5]],
+                    logic=row[6],
+                    code=row[7],
+                    explanation=row[8],
+                    parameters=row[9] or {},
+                    dependencies=row[10] or [],
+                    is_approved=row[11],
+                    is_rejected=row[12],
+                ))
+
         return rules
 
+    # Monotonic-bucket memoization, same scheme as the probe caches in
+    # geppetto.api: the bucket index changes every _CONFIG_CACHE_TTL_S
+    # seconds, so repeat lookups within a bucket are dict hits and stale
+    # entries age out without any timer bookkeeping.
+    @lru_cache(maxsize=256)
+    def _project_bucket(self, project_id: str, bucket: int) -> Optional[ProjectConfig]:
+        return self.get_project(project_id)
+
+    @lru_cache(maxsize=256)
+    def _rules_bucket(self, project_id: str, bucket: int) -> List[DiscrepancyRule]:
+        return self.fetch_project_rules(project_id)
+
+    @lru_cache(maxsize=8)
+    def _active_projects_bucket(self, limit: int, bucket: int) -> List[ProjectConfig]:
+        return self.fetch_active_projects(limit)
+
+    def get_project_cached(self, project_id: str) -> Optional[ProjectConfig]:
+        """
+        Fetch a project by ID, served from a short-lived cache.
+
+        Results may be up to _CONFIG_CACHE_TTL_S seconds stale; use
+        get_project directly when freshness matters.
+
+        Args:
+            project_id: The project identifier
+
+        Returns:
+            ProjectConfig if found, None otherwise
+        """
+        return self._project_bucket(
+            project_id, int(time.monotonic() / _CONFIG_CACHE_TTL_S)
+        )
+
+    def fetch_project_rules_cached(self, project_id: str) -> List[DiscrepancyRule]:
+        """
+        Fetch a project's discrepancy rules, served from a short-lived cache.
+
+        Args:
+            project_id: The project identifier
+
+        Returns:
+            List of DiscrepancyRule objects (up to _CONFIG_CACHE_TTL_S
+            seconds stale)
+        """
+        return self._rules_bucket(
+            project_id, int(time.monotonic() / _CONFIG_CACHE_TTL_S)
+        )
+
+    def fetch_active_projects_cached(self, limit: int = 10) -> List[ProjectConfig]:
+        """
+        Fetch active projects, deduplicating back-to-back calls.
+
+        Repeat calls with the same limit within
+        _ACTIVE_PROJECTS_CACHE_TTL_S seconds reuse the previous result
+        instead of re-running the query.
+
+        Args:
+            limit: Maximum number of projects to fetch
+
+        Returns:
+            List of ProjectConfig objects
+        """
+        return self._active_projects_bucket(
+            limit, int(time.monotonic() / _ACTIVE_PROJECTS_CACHE_TTL_S)
+        )
+
+    def invalidate_config_caches(self) -> None:
+        """Drop all cached project configs and rules immediately."""
+        self._project_bucket.cache_clear()
+        self._rules_bucket.cache_clear()
+        self._active_projects_bucket.cache_clear()
+
     def create_execution(
         self,
         project_id: str,
         scheduled_for: datetime,
         status: ExecutionStatus = ExecutionStatus.PENDING,
+        cur: Optional[Cursor] = None,
     ) -> int:
         """
         Create a new execution record.
-        
+
         Args:
             project_id: The project identifier
             scheduled_for: When this execution was scheduled
             status: Initial status (default: PENDING)
-            
+            cur: Optional cursor to reuse (see cursor())
+
         Returns:
             The ID of the created execution record
         """
-        query = """
-            INSERT INTO project_executions (project_id, status, scheduled_for)
-            VALUES (%s, %s, %s)
-            RETURNING id
+        with self._cursor(cur) as cur:
+            cur.execute(
+                _Q_CREATE_EXECUTION,
+                (project_id, _STATUS_VALUE[status], scheduled_for),
+                prepare=True,
+            )
+            result = cur.fetchone()
+            return result[0]
+
+    def create_and_start_execution(
+        self,
+        project_id: str,
+        scheduled_for: datetime,
+        cur: Optional[Cursor] = None,
+    ) -> int:
         """
-        
-        with self._get_connection() as conn:
+        Create an execution record already in RUNNING state.
+
+        Replaces the PENDING insert + RUNNING update pair with a single
+        INSERT; started_at is set to NOW() by the database.
+
+        Args:
+            project_id: The project identifier
+            scheduled_for: When this execution was scheduled
+            cur: Optional cursor to reuse (see cursor())
+
+        Returns:
+            The ID of the created execution record
+        """
+        with self._cursor(cur) as cur:
+            cur.execute(
+                _Q_CREATE_AND_START_EXECUTION,
+                (project_id, scheduled_for),
+                prepare=True,
+            )
+            return cur.fetchone()[0]
+
+    def create_executions_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Bulk-insert execution records via COPY.
+
+        COPY streams all rows in one round trip, so a backfill of N
+        records costs the same protocol overhead as one INSERT. COPY
+        cannot RETURN ids; callers that need the new id should use
+        create_execution instead.
+
+        Args:
+            rows: Dicts with project_id, status (ExecutionStatus or its
+                value) and scheduled_for
+        """
+        if not rows:
+            return
+
+        with self.pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (project_id, status.value, scheduled_for))
-                result = cur.fetchone()
-                conn.commit()
-                return result[0]
+                with cur.copy(
+                    "COPY project_executions (project_id, status, scheduled_for) FROM STDIN"
+                ) as copy:
+                    for row in rows:
+                        status = row["status"]
+                        if isinstance(status, ExecutionStatus):
+                            status = _STATUS_VALUE[status]
+                        copy.write_row(
+                            (row["project_id"], status, row["scheduled_for"])
+                        )
+
+    def create_execution_if_project_exists(
+        self,
+        project_id: str,
+        scheduled_for: datetime,
+        status: ExecutionStatus = ExecutionStatus.PENDING,
+        cur: Optional[Cursor] = None,
+    ) -> Optional[int]:
+        """
+        Create an execution record only if the project exists.
+
+        One round trip replaces the SELECT-then-INSERT pair, which also
+        closes the window where the project could be deleted between the
+        two statements.
+
+        Args:
+            project_id: The project identifier
+            scheduled_for: When this execution was scheduled
+            status: Initial status (default: PENDING)
+            cur: Optional cursor to reuse (see cursor())
+
+        Returns:
+            The ID of the created execution record, or None if the
+            project does not exist
+        """
+        with self._cursor(cur) as cur:
+            cur.execute(
+                _Q_CREATE_EXECUTION_IF_PROJECT,
+                (project_id, _STATUS_VALUE[status], scheduled_for, project_id),
+                prepare=True,
+            )
+            row = cur.fetchone()
+            return row[0] if row else None
 
     def update_execution_status(
         self,
@@ -218,10 +559,11 @@ class DatabaseClient:
         finished_at: Optional[datetime] = None,
         exit_code: Optional[int] = None,
         error_message: Optional[str] = None,
+        cur: Optional[Cursor] = None,
     ) -> None:
         """
         Update an execution record's status and metadata.
-        
+
         Args:
             execution_id: The execution record ID
             status: New status
@@ -229,38 +571,110 @@ class DatabaseClient:
             finished_at: When execution finished
             exit_code: Process exit code
             error_message: Error message if failed
+            cur: Optional cursor to reuse (see cursor())
         """
-        updates = ["status = %s"]
-        params: List[Any] = [status.value]
-        
-        if started_at is not None:
-            updates.append("started_at = %s")
-            params.append(started_at)
-        
-        if finished_at is not None:
-            updates.append("finished_at = %s")
-            params.append(finished_at)
-        
-        if exit_code is not None:
-            updates.append("exit_code = %s")
-            params.append(exit_code)
-        
-        if error_message is not None:
-            updates.append("error_message = %s")
-            params.append(error_message)
-        
-        params.append(execution_id)
-        
+        params = (
+            _STATUS_VALUE[status],
+            started_at,
+            finished_at,
+            exit_code,
+            error_message,
+            execution_id,
+        )
+
+        with self._cursor(cur) as cur:
+            cur.execute(_Q_UPDATE_EXECUTION, params, prepare=True)
+
+    def update_and_return(
+        self,
+        execution_id: int,
+        status: ExecutionStatus,
+        started_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None,
+        exit_code: Optional[int] = None,
+        error_message: Optional[str] = None,
+        cur: Optional[Cursor] = None,
+    ) -> Optional[ProjectExecution]:
+        """
+        Update an execution record and return the resulting row.
+
+        UPDATE ... RETURNING folds the trailing get_execution fetch into
+        the update itself, saving a round trip per execution.
+
+        Args:
+            execution_id: The execution record ID
+            status: New status
+            started_at: When execution started
+            finished_at: When execution finished
+            exit_code: Process exit code
+            error_message: Error message if failed
+            cur: Optional cursor to reuse (see cursor())
+
+        Returns:
+            The updated ProjectExecution, or None if the ID is unknown
+        """
+        params = (
+            _STATUS_VALUE[status],
+            started_at,
+            finished_at,
+            exit_code,
+            error_message,
+            execution_id,
+        )
+
+        with self._cursor(cur) as cur:
+            cur.execute(_Q_UPDATE_EXECUTION_RETURNING, params, prepare=True)
+            row = cur.fetchone()
+            return _execution_from_row(row) if row else None
+
+    def update_execution_status_many(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Apply many execution-status updates in a single round trip.
+
+        One UPDATE ... FROM (VALUES ...) statement replaces N individual
+        UPDATEs, so a burst of K transitions costs one network exchange
+        instead of K.
+
+        Args:
+            updates: Dicts with "execution_id" and "status" (ExecutionStatus
+                or its value), plus optional started_at, finished_at,
+                exit_code and error_message. Omitted fields keep their
+                current value.
+        """
+        if not updates:
+            return
+
+        row_sql = "(%s::bigint, %s::text, %s::timestamptz, %s::timestamptz, %s::int, %s::text)"
         query = f"""
-            UPDATE project_executions
-            SET {', '.join(updates)}
-            WHERE id = %s
+            UPDATE project_executions AS pe
+            SET
+                status = v.status,
+                started_at = COALESCE(v.started_at, pe.started_at),
+                finished_at = COALESCE(v.finished_at, pe.finished_at),
+                exit_code = COALESCE(v.exit_code, pe.exit_code),
+                error_message = COALESCE(v.error_message, pe.error_message)
+            FROM (VALUES {", ".join([row_sql] * len(updates))})
+                AS v(id, status, started_at, finished_at, exit_code, error_message)
+            WHERE pe.id = v.id
         """
-        
-        with self._get_connection() as conn:
+
+        params: List[Any] = []
+        for update in updates:
+            status = update["status"]
+            if isinstance(status, ExecutionStatus):
+                status = _STATUS_VALUE[status]
+            params.extend((
+                update["execution_id"],
+                status,
+                update.get("started_at"),
+                update.get("finished_at"),
+                update.get("exit_code"),
+                update.get("error_message"),
+            ))
+
+        with self.pool.connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, params)
-                conn.commit()
 
     def get_execution(self, execution_id: int) -> Optional[ProjectExecution]:
         """
@@ -272,33 +686,15 @@ class DatabaseClient:
         Returns:
             ProjectExecution if found, None otherwise
         """
-        query = """
-            SELECT
-                id, project_id, status, scheduled_for,
-                started_at, finished_at, exit_code, error_message, created_at
-            FROM project_executions
-            WHERE id = %s
-        """
-        
-        with self._get_connection() as conn:
+        with self.pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (execution_id,))
+                cur.execute(_Q_GET_EXECUTION, (execution_id,), prepare=True)
                 row = cur.fetchone()
                 
                 if not row:
                     return None
                 
-                return ProjectExecution(
-                    id=row[0],
-                    project_id=row[1],
-                    status=ExecutionStatus(row[2]),
-                    scheduled_for=row[3],
-                    started_at=row[4],
-                    finished_at=row[5],
-                    exit_code=row[6],
-                    error_message=row[7],
-                    created_at=row[8],
-                )
+                return _execution_from_row(row)
 
     def get_project_executions(
         self,
@@ -315,36 +711,52 @@ class DatabaseClient:
         Returns:
             List of ProjectExecution objects, most recent first
         """
-        query = """
-            SELECT
-                id, project_id, status, scheduled_for,
-                started_at, finished_at, exit_code, error_message, created_at
-            FROM project_executions
-            WHERE project_id = %s
-            ORDER BY created_at DESC
-            LIMIT %s
+        with self.pool.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(_Q_PROJECT_EXECUTIONS, (project_id, limit), prepare=True)
+                return [_execution_from_row(row) for row in cur]
+
+    def iter_project_executions(
+        self,
+        project_id: str,
+        limit: int = 50,
+        batch_size: int = 100,
+    ):
         """
-        
-        executions = []
-        with self._get_connection() as conn:
+        Stream execution history for a project.
+
+        Rows are fetched in batches and yielded one at a time so callers
+        can serialize incrementally instead of materializing the full
+        page in memory.
+
+        Args:
+            project_id: The project identifier
+            limit: Maximum number of records to yield
+            batch_size: Rows fetched per database round trip
+
+        Yields:
+            ProjectExecution objects, most recent first
+        """
+        with self.pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (project_id, limit))
-                rows = cur.fetchall()
-                
-                for row in rows:
-                    executions.append(ProjectExecution(
-                        id=row[0],
-                        project_id=row[1],
-                        status=ExecutionStatus(row[2]),
-                        scheduled_for=row[3],
-                        started_at=row[4],
-                        finished_at=row[5],
-                        exit_code=row[6],
-                        error_message=row[7],
-                        created_at=row[8],
-                    ))
-        
-        return executions
+                cur.execute(_Q_PROJECT_EXECUTIONS, (project_id, limit), prepare=True)
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield ProjectExecution(
+                            id=row[0],
+                            project_id=row[1],
+                            status=ExecutionStatus(row[2]),
+                            scheduled_for=row[3],
+                            started_at=row[4],
+                            finished_at=row[5],
+                            exit_code=row[6],
+                            error_message=row[7],
+                            created_at=row[8],
+                            duration_seconds=row[9],
+                        )
 
     def get_running_execution(self, project_id: str) -> Optional[ProjectExecution]:
         """
@@ -356,34 +768,15 @@ class DatabaseClient:
         Returns:
             ProjectExecution if running, None otherwise
         """
-        query = """
-            SELECT
-                id, project_id, status, scheduled_for,
-                started_at, finished_at, exit_code, error_message, created_at
-            FROM project_executions
-            WHERE project_id = %s AND status = 'running'
-            LIMIT 1
-        """
-        
-        with self._get_connection() as conn:
+        with self.pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (project_id,))
+                cur.execute(_Q_RUNNING_EXECUTION, (project_id,), prepare=True)
                 row = cur.fetchone()
                 
                 if not row:
                     return None
                 
-                return ProjectExecution(
-                    id=row[0],
-                    project_id=row[1],
-                    status=ExecutionStatus(row[2]),
-                    scheduled_for=row[3],
-                    started_at=row[4],
-                    finished_at=row[5],
-                    exit_code=row[6],
-                    error_message=row[7],
-                    created_at=row[8],
-                )
+                return _execution_from_row(row)
 
     def get_execution_stats(self) -> Dict[str, int]:
         """
@@ -392,20 +785,7 @@ class DatabaseClient:
         Returns:
             Dictionary with execution counts by status
         """
-        query = """
-            SELECT status, COUNT(*) as count
-            FROM project_executions
-            GROUP BY status
-        """
-        
-        stats = {status.value: 0 for status in ExecutionStatus}
-        
-        with self._get_connection() as conn:
+        with self.pool.connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query)
-                rows = cur.fetchall()
-                
-                for row in rows:
-                    stats[row[0]] = row[1]
-        
-        return stats
+                cur.execute(_Q_EXECUTION_STATS, prepare=True)
+                return {**_ZERO_STATS, **dict(cur)}
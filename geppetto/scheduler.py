@@ -3,13 +3,18 @@ Scheduler for managing project execution based on cron expressions.
 Uses a priority queue to determine which project should run next.
 """
 import heapq
+import logging
+import itertools
+import re
 import threading
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional
 
+from zoneinfo import ZoneInfo
+
 from croniter import croniter
-import pytz
 
 from geppetto.data.models.execution import (
     ProjectConfig,
@@ -19,6 +24,37 @@ from geppetto.data.models.execution import (
 from geppetto.db.client import DatabaseClient
 
 
+logger = logging.getLogger(__name__)
+
+# "* * * * *" or "*/N * * * *" — the only shapes the arithmetic fast
+# path below handles.
+_SIMPLE_MINUTE_CRON = re.compile(r"^(\*|\*/(\d+)) \* \* \* \*$")
+
+# Ceiling for the idle backoff wait; also bounds how late the loop can
+# notice a project inserted by refresh while it slept.
+_MAX_IDLE_WAIT_S = 30.0
+_BACKOFF_FACTOR = 1.5
+
+
+@lru_cache(maxsize=512)
+def _fixed_period_seconds(expr: str) -> Optional[int]:
+    """
+    Period in seconds for fixed-interval minute expressions.
+
+    Only steps that divide 60 qualify: their ticks are exact multiples
+    of the period since the epoch, so the next tick is integer
+    arithmetic. Anything else (hour/day fields, uneven steps that reset
+    at the hour boundary) returns None and goes through croniter.
+    """
+    match = _SIMPLE_MINUTE_CRON.match(expr.strip())
+    if not match:
+        return None
+    step = int(match.group(2)) if match.group(2) else 1
+    if step <= 0 or 60 % step:
+        return None
+    return step * 60
+
+
 class ProjectScheduler:
     """
     Manages scheduling of project executions based on cron expressions.
@@ -43,17 +79,70 @@ class ProjectScheduler:
         self.max_queue_size = max_queue_size
         self.check_interval = check_interval
         
-        # Priority queue: (next_run_timestamp, project_id, ScheduledProject)
+        # Priority queue: (next_run_ts, push_epoch, project_id, ScheduledProject).
+        # The epoch is a monotonically increasing counter that breaks
+        # timestamp ties with one integer compare (and FIFO order for
+        # same-tick schedules) instead of falling back to string
+        # comparison of project ids.
         self._queue: List[tuple] = []
+        self._push_epoch = itertools.count()
+        # Bumped under _queue_lock on every queue mutation; lets
+        # get_queue_status reuse its last rendered result while the
+        # queue is unchanged between monitoring polls.
+        self._queue_version = 0
+        self._queue_status_cache: Optional[tuple] = None
         self._projects: Dict[str, ProjectConfig] = {}
-        self._lock = threading.Lock()
-        
+        # Secondary index for O(1) per-project lookups; kept in sync with
+        # the heap at every push/pop site.
+        self._by_id: Dict[str, ScheduledProject] = {}
+        # Parsed-schedule caches: croniter construction re-runs the
+        # regex expansion of the cron expression and ZoneInfo
+        # re-resolves the zone on every call, but both are pure
+        # functions of the project's schedule fields. Cached instances
+        # are rebased with set_current() per call instead.
+        self._cron_cache: Dict[tuple, croniter] = {}
+        self._tz_cache: Dict[str, object] = {}
+        # Queue state and status counters have distinct access patterns
+        # (scheduler tick vs monitoring), so each gets its own lock:
+        # status bookkeeping never stalls pop_if_due and vice versa.
+        self._queue_lock = threading.Lock()
+        self._status_lock = threading.Lock()
+
+        # Full refreshes (one DB query + heap rebuild + cron recompute
+        # for every project) are limited to once per interval; between
+        # them the pre-execution check is a single-row query.
+        self._refresh_interval = 30.0
+        self._last_refresh_ts = 0.0
+
         self._running = False
         self._scheduler_thread: Optional[threading.Thread] = None
+        # Last tick time as a raw epoch float; a datetime is only
+        # materialized for display inside get_status().
+        self._last_check_ts = 0.0
+        self._stop_event = threading.Event()
         self._on_execute: Optional[Callable[[ScheduledProject], None]] = None
-        
-        # Status tracking
+
+        # Status tracking. _status is mutated under _status_lock;
+        # _status_snapshot is an immutable copy republished after every
+        # mutation so readers never need a lock.
         self._status = RunnerStatus()
+        self._status_snapshot = self._status.model_copy()
+
+    def _publish_status(self) -> None:
+        """
+        Publish a copy of the live status for lock-free reads.
+
+        Reference assignment is atomic under the GIL, so get_status()
+        callers see a consistent snapshot without acquiring a lock —
+        probe fanout never contends with the scheduler thread.
+        """
+        self._status_snapshot = self._status.model_copy()
+
+    def _set_queue_size(self, count: int) -> None:
+        """Record the queue size in the status, under the status lock only."""
+        with self._status_lock:
+            self._status.projects_in_queue = count
+            self._publish_status()
 
     def _get_next_run(self, project: ProjectConfig, base_time: Optional[datetime] = None) -> datetime:
         """
@@ -68,117 +157,147 @@ class ProjectScheduler:
         """
         if base_time is None:
             base_time = datetime.now(timezone.utc)
-        
-        # Handle timezone
-        tz = pytz.timezone(project.timezone)
-        local_time = base_time.astimezone(tz)
-        
-        # Calculate next run using croniter
-        cron = croniter(project.cron_expression, local_time)
+
+        # Fast gate for fixed-period minute schedules in UTC: the next
+        # tick is one integer division, no croniter stepping. Restricted
+        # to UTC so wall-clock offsets can't skew the alignment.
+        if project.timezone == "UTC":
+            period = _fixed_period_seconds(project.cron_expression)
+            if period is not None:
+                next_ts = (int(base_time.timestamp() // period) + 1) * period
+                return datetime.fromtimestamp(next_ts, timezone.utc)
+
+        # Handle timezone. UTC skips the conversion outright — base_time
+        # is already UTC-aware; other zones go through zoneinfo (the
+        # process-wide ZoneInfo cache makes repeat constructions cheap,
+        # and the instance cache here avoids even that lookup).
+        if project.timezone == "UTC":
+            local_time = base_time
+        else:
+            tz = self._tz_cache.get(project.timezone)
+            if tz is None:
+                tz = self._tz_cache.setdefault(
+                    project.timezone, ZoneInfo(project.timezone)
+                )
+            local_time = base_time.astimezone(tz)
+
+        # Calculate next run using croniter; the parsed instance is
+        # cached per (expression, timezone) and rebased onto base_time,
+        # skipping the expression expansion on repeat calls.
+        key = (project.cron_expression, project.timezone)
+        cron = self._cron_cache.get(key)
+        if cron is None:
+            cron = self._cron_cache[key] = croniter(project.cron_expression, local_time)
+        else:
+            cron.set_current(local_time, force=True)
         next_local = cron.get_next(datetime)
-        
-        # Convert back to UTC
+
+        # Convert back to UTC (no-op conversion skipped for UTC projects)
+        if project.timezone == "UTC":
+            return next_local
         return next_local.astimezone(timezone.utc)
 
     def load_projects(self) -> None:
         """
         Load active projects from the database and populate the queue.
         """
-        with self._lock:
+        with self._queue_lock:
             # Fetch projects
-            projects = self.db_client.fetch_active_projects(limit=self.max_queue_size)
+            projects = self.db_client.fetch_active_projects_cached(limit=self.max_queue_size)
             
             # Clear current state
             self._queue = []
             self._projects = {}
-            
+            self._by_id = {}
+
             # Add each project to the queue
             now = datetime.now(timezone.utc)
             for project in projects:
                 self._projects[project.id] = project
                 next_run = self._get_next_run(project, now)
-                
+
                 scheduled = ScheduledProject(
                     project=project,
                     next_run=next_run,
                 )
-                
+
                 # Push to priority queue (heapq uses min-heap)
                 heapq.heappush(
                     self._queue,
-                    (next_run.timestamp(), project.id, scheduled)
+                    (next_run.timestamp(), next(self._push_epoch), project.id, scheduled)
                 )
-            
-            self._status.projects_in_queue = len(self._queue)
-            print(f"Loaded {len(projects)} projects into scheduler queue")
+                self._by_id[project.id] = scheduled
+
+            self._queue_version += 1
+            count = len(self._queue)
+
+        self._set_queue_size(count)
+        logger.info("Loaded %d projects into scheduler queue", len(projects))
 
     def refresh_projects(self) -> None:
         """
         Refresh projects from the database, updating the queue.
         Preserves next_run times for existing projects.
         """
-        with self._lock:
+        with self._queue_lock:
             # Fetch fresh project list
-            projects = self.db_client.fetch_active_projects(limit=self.max_queue_size)
-            new_project_ids = {p.id for p in projects}
-            
-            # Build map of current scheduled projects
-            current_scheduled = {item[1]: item[2] for item in self._queue}
-            
-            # Rebuild queue
-            self._queue = []
-            self._projects = {}
-            
-            now = datetime.now(timezone.utc)
-            for project in projects:
-                self._projects[project.id] = project
-                
-                # Preserve next_run if project already scheduled
-                if project.id in current_scheduled:
-                    scheduled = current_scheduled[project.id]
-                    # Update project config but keep next_run
-                    scheduled.project = project
-                else:
-                    # New project, calculate next run
-                    next_run = self._get_next_run(project, now)
-                    scheduled = ScheduledProject(
-                        project=project,
-                        next_run=next_run,
+            projects = self.db_client.fetch_active_projects_cached(limit=self.max_queue_size)
+            new_by_id = {p.id: p for p in projects}
+
+            if new_by_id.keys() == self._projects.keys():
+                # Common case: project membership is unchanged. Only the
+                # config payloads can differ, and next_run values stay
+                # as they were, so the heap ordering is still valid —
+                # update entries in place in O(N) instead of discarding
+                # and re-pushing the whole queue at O(N log N).
+                for project_id, project in new_by_id.items():
+                    self._projects[project_id] = project
+                    scheduled = self._by_id.get(project_id)
+                    if scheduled is not None:
+                        scheduled.project = project
+            else:
+                # Membership changed: rebuild the queue
+                current_scheduled = {item[2]: item[3] for item in self._queue}
+
+                self._queue = []
+                self._projects = {}
+                self._by_id = {}
+
+                now = datetime.now(timezone.utc)
+                for project in projects:
+                    self._projects[project.id] = project
+
+                    # Preserve next_run if project already scheduled
+                    if project.id in current_scheduled:
+                        scheduled = current_scheduled[project.id]
+                        # Update project config but keep next_run
+                        scheduled.project = project
+                    else:
+                        # New project, calculate next run
+                        next_run = self._get_next_run(project, now)
+                        scheduled = ScheduledProject(
+                            project=project,
+                            next_run=next_run,
+                        )
+
+                    heapq.heappush(
+                        self._queue,
+                        (scheduled.next_run.timestamp(), next(self._push_epoch), project.id, scheduled)
                     )
-                
-                heapq.heappush(
-                    self._queue,
-                    (scheduled.next_run.timestamp(), project.id, scheduled)
-                )
-            
-            self._status.projects_in_queue = len(self._queue)
+                    self._by_id[project.id] = scheduled
 
-    def _reschedule_project(self, project_id: str) -> None:
-        """
-        Reschedule a project for its next run after execution.
-        
-        Args:
-            project_id: The project to reschedule
-        """
-        with self._lock:
-            if project_id not in self._projects:
-                return
-            
-            project = self._projects[project_id]
-            now = datetime.now(timezone.utc)
-            next_run = self._get_next_run(project, now)
-            
-            scheduled = ScheduledProject(
-                project=project,
-                next_run=next_run,
-            )
-            
-            heapq.heappush(
-                self._queue,
-                (next_run.timestamp(), project_id, scheduled)
-            )
-            
-            self._status.projects_in_queue = len(self._queue)
+            self._queue_version += 1
+
+            # Drop cron cache entries no active project uses anymore
+            active_keys = {(p.cron_expression, p.timezone) for p in projects}
+            for key in list(self._cron_cache):
+                if key not in active_keys:
+                    del self._cron_cache[key]
+
+            count = len(self._queue)
+
+        self._last_refresh_ts = time.monotonic()
+        self._set_queue_size(count)
 
     def get_next_scheduled(self) -> Optional[ScheduledProject]:
         """
@@ -187,31 +306,60 @@ class ProjectScheduler:
         Returns:
             The next scheduled project, or None if queue is empty
         """
-        with self._lock:
+        with self._queue_lock:
             if not self._queue:
                 return None
-            return self._queue[0][2]
+            return self._queue[0][3]
 
-    def pop_if_due(self) -> Optional[ScheduledProject]:
+    def _pop_and_reschedule_if_due(self) -> Optional[ScheduledProject]:
         """
-        Pop and return the next project if it's due for execution.
-        
+        Return the next project if it's due, rescheduling it in place.
+
+        Popping the due entry and pushing its successor are fused into
+        one heapreplace — a single sift instead of a heappop/heappush
+        pair, and one lock acquisition per execution cycle instead of
+        two. The returned snapshot is handed to the executor while the
+        heap already holds the follow-up run.
+
         Returns:
             ScheduledProject if one is due, None otherwise
         """
-        with self._lock:
+        with self._queue_lock:
             if not self._queue:
                 return None
-            
-            now = datetime.now(timezone.utc)
-            next_ts, project_id, scheduled = self._queue[0]
-            
-            if next_ts <= now.timestamp():
+
+            next_ts, _, project_id, scheduled = self._queue[0]
+
+            # Compare raw epoch floats; building a tz-aware datetime
+            # just to call .timestamp() on it costs an allocation per
+            # tick for no extra information.
+            if next_ts > time.time():
+                return None
+
+            project = self._projects.get(project_id)
+            if project is None:
+                # No longer active: drop the entry instead of
+                # rescheduling it, and don't hand it to the caller
+                # either — a dropped project must not execute.
                 heapq.heappop(self._queue)
-                self._status.projects_in_queue = len(self._queue)
-                return scheduled
-            
-            return None
+                self._by_id.pop(project_id, None)
+                scheduled = None
+            else:
+                next_run = self._get_next_run(project)
+                successor = ScheduledProject(
+                    project=project,
+                    next_run=next_run,
+                )
+                heapq.heapreplace(
+                    self._queue,
+                    (next_run.timestamp(), next(self._push_epoch), project_id, successor),
+                )
+                self._by_id[project_id] = successor
+            self._queue_version += 1
+            count = len(self._queue)
+
+        self._set_queue_size(count)
+        return scheduled
 
     def set_on_execute(self, callback: Callable[[ScheduledProject], None]) -> None:
         """
@@ -222,105 +370,231 @@ class ProjectScheduler:
         """
         self._on_execute = callback
 
+    def _wait_for_next_tick(self, backoff: float) -> None:
+        """
+        Sleep until the next deadline, an escalating idle tick, or stop().
+
+        The wait is bounded by check_interval * backoff (capped at
+        _MAX_IDLE_WAIT_S) but never overshoots the head-of-queue
+        deadline, so idle periods cost few wakeups while imminent runs
+        still fire on time. Event.wait lets stop() interrupt instantly.
+        """
+        wait_s = min(self.check_interval * backoff, _MAX_IDLE_WAIT_S)
+
+        with self._queue_lock:
+            next_ts = self._queue[0][0] if self._queue else None
+        if next_ts is not None:
+            wait_s = min(wait_s, max(0.0, next_ts - time.time()))
+
+        self._stop_event.wait(wait_s)
+
     def _scheduler_loop(self) -> None:
         """Main scheduler loop that checks for due projects."""
-        print("Scheduler loop started")
+        logger.info("Scheduler loop started")
+        backoff = 1.0
 
         while self._running:
             try:
-                self._status.last_check_time = datetime.now(timezone.utc)
+                # Float store is GIL-atomic; no lock or status copy per
+                # tick just to record "the loop is alive".
+                self._last_check_ts = time.time()
 
-                # Check if any project is due
-                scheduled = self.pop_if_due()
+                # Check if any project is due; the follow-up run is
+                # already queued when this returns.
+                scheduled = self._pop_and_reschedule_if_due()
 
                 if scheduled and self._on_execute:
+                    backoff = 1.0
                     project_id = scheduled.project.id
 
-                    # Refresh projects from database before execution to ensure
-                    # we have the latest config and the project is still active
-                    print(f"Refreshing projects before executing {project_id}")
-                    self.refresh_projects()
+                    # A full refresh (fetch-all + heap rebuild + cron
+                    # recompute) runs at most every _refresh_interval;
+                    # between refreshes a single-row fetch re-validates
+                    # just the project about to run.
+                    if time.monotonic() - self._last_refresh_ts > self._refresh_interval:
+                        logger.debug("Refreshing projects before executing %s", project_id)
+                        self.refresh_projects()
+
+                        # Check if project is still active after refresh
+                        if project_id not in self._projects:
+                            logger.warning("Project %s is no longer active, skipping execution", project_id)
+                            continue
 
-                    # Check if project is still active after refresh
-                    if project_id not in self._projects:
-                        print(f"Project {project_id} is no longer active, skipping execution")
-                        continue
+                        updated_project = self._projects[project_id]
+                    else:
+                        updated_project = self.db_client.get_active_project(project_id)
+                        if updated_project is None:
+                            logger.warning("Project %s is no longer active, skipping execution", project_id)
+                            with self._queue_lock:
+                                self._projects.pop(project_id, None)
+                            continue
 
-                    # Get the latest project config after refresh
-                    updated_project = self._projects[project_id]
+                        with self._queue_lock:
+                            self._projects[project_id] = updated_project
+
+                    # Execute with the latest project config
                     scheduled.project = updated_project
 
-                    self._status.currently_executing = project_id
+                    with self._status_lock:
+                        self._status.currently_executing = project_id
+                        self._publish_status()
 
                     try:
                         # Execute the project with latest config
                         self._on_execute(scheduled)
-                        self._status.successful_executions += 1
+                        with self._status_lock:
+                            self._status.successful_executions += 1
                     except Exception as e:
-                        print(f"Error executing project {project_id}: {e}")
-                        self._status.failed_executions += 1
+                        logger.error("Error executing project %s: %s", project_id, e)
+                        with self._status_lock:
+                            self._status.failed_executions += 1
                     finally:
-                        self._status.total_executions += 1
-                        self._status.currently_executing = None
-
-                        # Reschedule for next run (only if still active)
-                        if project_id in self._projects:
-                            self._reschedule_project(project_id)
+                        with self._status_lock:
+                            self._status.total_executions += 1
+                            self._status.currently_executing = None
+                            self._publish_status()
 
-                # Sleep before next check
-                time.sleep(self.check_interval)
+                # Sleep before next check; empty ticks back off
+                # geometrically so an idle queue costs few wakeups.
+                if scheduled is None:
+                    self._wait_for_next_tick(backoff)
+                    backoff = min(backoff * _BACKOFF_FACTOR, _MAX_IDLE_WAIT_S / self.check_interval)
+                else:
+                    self._stop_event.wait(self.check_interval)
 
             except Exception as e:
-                print(f"Scheduler error: {e}")
-                time.sleep(self.check_interval)
+                logger.error("Scheduler error: %s", e)
+                self._stop_event.wait(self.check_interval)
 
     def start(self) -> None:
         """Start the scheduler in a background thread."""
         if self._running:
-            print("Scheduler is already running")
+            logger.warning("Scheduler is already running")
             return
         
         self._running = True
-        self._status.is_running = True
-        
+        self._stop_event.clear()
+        with self._status_lock:
+            self._status.is_running = True
+            self._publish_status()
+
         self._scheduler_thread = threading.Thread(
             target=self._scheduler_loop,
             daemon=True,
             name="project-scheduler",
         )
         self._scheduler_thread.start()
-        print("Scheduler started")
+        logger.info("Scheduler started")
 
     def stop(self) -> None:
         """Stop the scheduler."""
         self._running = False
-        self._status.is_running = False
-        
+        # Wake the loop out of any in-progress wait immediately.
+        self._stop_event.set()
+        with self._status_lock:
+            self._status.is_running = False
+            self._publish_status()
+
         if self._scheduler_thread:
             self._scheduler_thread.join(timeout=5.0)
             self._scheduler_thread = None
         
-        print("Scheduler stopped")
+        logger.info("Scheduler stopped")
 
     def get_status(self) -> RunnerStatus:
-        """Get the current runner status."""
-        return self._status
+        """
+        Get the current runner status.
 
-    def get_queue_status(self) -> List[Dict]:
+        Returns the last published snapshot; the read path takes no lock
+        and never observes a half-updated status. last_check_time is
+        materialized here from the epoch float the loop records.
+        """
+        status = self._status_snapshot
+        if self._last_check_ts:
+            status = status.model_copy(
+                update={
+                    "last_check_time": datetime.fromtimestamp(
+                        self._last_check_ts, timezone.utc
+                    )
+                }
+            )
+        return status
+
+    def get_queue_status(self, limit: Optional[int] = None) -> List[Dict]:
         """
         Get the current state of the scheduling queue.
-        
+
+        Args:
+            limit: Return only the next `limit` projects by run time;
+                None returns the whole queue
+
         Returns:
             List of projects with their next scheduled run times
         """
-        with self._lock:
-            result = []
-            for ts, project_id, scheduled in sorted(self._queue):
-                result.append({
-                    "project_id": project_id,
-                    "project_name": scheduled.project.name,
-                    "next_run": scheduled.next_run.isoformat(),
-                    "cron_expression": scheduled.project.cron_expression,
-                    "timezone": scheduled.project.timezone,
-                })
-            return result
+        # Monitoring polls far outnumber queue mutations, so the
+        # rendered rows are cached per (queue version, limit): repeat
+        # polls on an unchanged queue skip the sort, the attribute
+        # chasing through the Pydantic models, and the isoformat calls
+        # entirely.
+        with self._queue_lock:
+            cached = self._queue_status_cache
+            version = self._queue_version
+            if cached is not None and cached[0] == (version, limit):
+                return cached[1]
+            snapshot = list(self._queue)
+
+        # Only the shallow copy happens under the lock; the ordering
+        # and per-entry dict construction run outside it, so monitoring
+        # polls no longer stall the scheduler tick. A bounded query
+        # selects the top entries in O(N log limit) instead of sorting
+        # everything.
+        if limit is not None:
+            snapshot = heapq.nsmallest(limit, snapshot)
+        else:
+            snapshot.sort()
+        rows = [
+            {
+                "project_id": project_id,
+                "project_name": scheduled.project.name,
+                "next_run": scheduled.next_run.isoformat(),
+                "cron_expression": scheduled.project.cron_expression,
+                "timezone": scheduled.project.timezone,
+            }
+            for ts, _, project_id, scheduled in snapshot
+        ]
+        self._queue_status_cache = ((version, limit), rows)
+        return rows
+
+    def contains(self, project_id: str) -> bool:
+        """
+        Whether the project is currently queued.
+
+        A single dict membership probe; safe without the lock since dict
+        reads are atomic under the GIL.
+        """
+        return project_id in self._by_id
+
+    def get_queue_item(self, project_id: str) -> Optional[Dict]:
+        """
+        Get the queue entry for a single project.
+
+        O(1) lookup via the project-id index rather than scanning the heap.
+
+        Args:
+            project_id: The project to look up
+
+        Returns:
+            Entry in the same shape as get_queue_status items, or None
+            if the project is not currently queued
+        """
+        with self._queue_lock:
+            scheduled = self._by_id.get(project_id)
+            if scheduled is None:
+                return None
+            return {
+                "project_id": project_id,
+                "project_name": scheduled.project.name,
+                "next_run": scheduled.next_run.isoformat(),
+                "cron_expression": scheduled.project.cron_expression,
+                "timezone": scheduled.project.timezone,
+            }
@@ -2,15 +2,28 @@
 Cricket Runner Manager
 A cron-based scheduler that runs discrepancy detection projects.
 """
+import logging
 import signal
 import sys
 import tomllib
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+from dotenv import load_dotenv
 from fastapi import FastAPI
 
-from config import settings
+# Load .env into os.environ once, so each Settings() build reads memory
+# instead of re-parsing the file.
+load_dotenv(".env", override=False)
+
+# Library modules log via logging.getLogger(__name__); the stdout echo
+# lives here in the entry point.
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+
+from config import get_settings
 from geppetto.api import create_monitoring_api
 from geppetto.db.client import DatabaseClient
 from geppetto.executor import ProjectExecutor
@@ -33,7 +46,9 @@ _executor: ProjectExecutor = None
 def create_components():
     """Create and configure the runner components."""
     global _db_client, _scheduler, _executor
-    
+
+    settings = get_settings()
+
     # Initialize components
     _db_client = DatabaseClient(settings.DATABASE_URL)
     synthesizer = CodeSynthesizer()
@@ -44,7 +59,7 @@ def create_components():
         synthesizer=synthesizer,
         work_dir=work_dir,
         timeout=settings.EXECUTION_TIMEOUT,
-        cdn_config=settings.get_cdn_config(),
+        cdn_config=settings.cdn_config,
         callback_url=settings.ENLIQ_REPORT_CALLBACK_URL,
     )
     
@@ -89,14 +104,19 @@ app = create_monitoring_api(_db_client, _scheduler, lifespan=lifespan, executor=
 def main():
     """CLI entry point for local development."""
     import uvicorn
-    
-    print(f"Starting Cricket Runner Manager on http://{settings.API_HOST}:{settings.API_PORT}")
+
+    settings = get_settings()
+    host = settings.API_HOST
+    port = settings.API_PORT
+    print(f"Starting Cricket Runner Manager on http://{host}:{port}")
     uvicorn.run(
         "main:app",
-        host=settings.API_HOST,
-        port=settings.API_PORT,
+        host=host,
+        port=port,
         log_level="info",
         reload=False,
+        loop="uvloop",
+        http="httptools",
     )
 
 
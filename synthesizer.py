@@ -1,16 +1,38 @@
+import ast
+import os
 import shutil
 import re
+import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Dict
+from typing import Any, FrozenSet, List, Dict
 from jinja2 import Environment, FileSystemLoader
+from pydantic import SecretStr
 from geppetto.data.models.data_source import DataSourceConfig
 from geppetto.data.models.rule import DiscrepancyRule
 
 
 logger = logging.getLogger(__name__)
 
-# Common import to package mapping
+# Compiled once at import: these run over every rule's code on every
+# generation, so the per-call re-cache lookup is worth avoiding.
+# MULTILINE lets one finditer pass over the whole source replace the
+# split('\n') + per-line match loop.
+_IMPORT_RE = re.compile(
+    r"^\s*(?:from\s+([\w.]+)\s+import|import\s+([\w.]+(?:\s*,\s*[\w.]+)*))",
+    re.MULTILINE,
+)
+_FUNCDEF_RE = re.compile(r"def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(")
+
+# The full standard library, not a hand-picked subset: any stdlib
+# import short-circuits before the package lookup, so modules like
+# "csv" or "hashlib" can never leak into the generated pyproject.toml
+# as bogus dependencies.
+_STDLIB_MODULES = frozenset(sys.stdlib_module_names)
+
+# Common import to package mapping (third-party only)
 IMPORT_TO_PACKAGE = {
     "polars": "polars>=0.20.0",
     "pl": "polars>=0.20.0",
@@ -18,14 +40,6 @@ IMPORT_TO_PACKAGE = {
     "pd": "pandas>=2.0.0",
     "numpy": "numpy>=1.24.0",
     "np": "numpy>=1.24.0",
-    "datetime": None,  # stdlib
-    "json": None,  # stdlib
-    "re": None,  # stdlib
-    "math": None,  # stdlib
-    "typing": None,  # stdlib
-    "collections": None,  # stdlib
-    "itertools": None,  # stdlib
-    "functools": None,  # stdlib
     "requests": "requests>=2.31.0",
     "httpx": "httpx>=0.25.0",
     "sqlalchemy": "sqlalchemy>=2.0.0",
@@ -37,13 +51,81 @@ IMPORT_TO_PACKAGE = {
 }
 
 
+def _unmask(value: Any) -> Any:
+    """Return the real value behind a SecretStr, or the value as-is."""
+    if isinstance(value, SecretStr):
+        return value.get_secret_value()
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _top_level_imports(code: str) -> FrozenSet[str]:
+    """
+    Top-level module names imported by a piece of detector code.
+
+    Parses with ast so parenthesized multi-line imports, aliased
+    imports ("import a as b, c as d") and conditional imports are all
+    seen; the line-oriented regex misses those shapes. Snippets that
+    don't parse (partial code) fall back to the regex scan. Results are
+    memoized per source string, so repeated generations over unchanged
+    rules skip parsing entirely.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        modules = set()
+        for match in _IMPORT_RE.finditer(code):
+            module = match.group(1) or match.group(2)
+            if module:
+                modules.add(module.split(".")[0].strip())
+        return frozenset(modules)
+
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                modules.add(alias.name.split(".")[0])
+        elif isinstance(node, ast.ImportFrom):
+            # Relative imports (level > 0) have no external module
+            if node.module and node.level == 0:
+                modules.add(node.module.split(".")[0])
+    return frozenset(modules)
+
+
+# Template Name -> Output Filename. Module-level so the environment can
+# compile every template once at construction time.
+_TEMPLATE_MAP = {
+    "logic/__init__.py.j2": "logic/__init__.py",
+    "logic/detectors.py.j2": "logic/detectors.py",
+    "logic/processor.py.j2": "logic/processor.py",
+    "utils/__init__.py.j2": "utils/__init__.py",
+    "utils/data_loader.py.j2": "utils/data_loader.py",
+    "main.py.j2": "main.py",
+    "config.py.j2": "config.py",
+    "pyproject.toml.j2": "pyproject.toml",
+    ".gitignore.j2": ".gitignore",
+}
+
+
 class CodeSynthesizer:
     def __init__(self, template_dir: str = "templates/child_app"):
         self.template_dir = Path(template_dir)
-        # Auto-reload disabled for production performance, enabled for debugging
+        # auto_reload=False skips the per-get_template stat() mtime
+        # check; templates ship with the image and never change at
+        # runtime.
         self.env = Environment(
-            loader=FileSystemLoader(self.template_dir), keep_trailing_newline=True
+            loader=FileSystemLoader(self.template_dir),
+            keep_trailing_newline=True,
+            auto_reload=False,
         )
+        # Compile all templates up front so generate_codebase never
+        # touches the loader on the hot path.
+        self._templates = {
+            name: self.env.get_template(name) for name in _TEMPLATE_MAP
+        }
+        # extract_dependencies output per rule-set identity; rule sets
+        # repeat across generations and the result is deterministic.
+        self._deps_cache: Dict[tuple, List[str]] = {}
 
     def prepare_detectors_context(self, rules: List[DiscrepancyRule]) -> List[Dict]:
         """
@@ -54,7 +136,7 @@ class CodeSynthesizer:
             # Extract function name from code
             func_name = f"check_{rule.rule_id}"
             if rule.code:
-                match = re.search(r"def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(", rule.code)
+                match = _FUNCDEF_RE.search(rule.code)
                 if match:
                     func_name = match.group(1)
 
@@ -94,10 +176,14 @@ class CodeSynthesizer:
             "batch_size": config_dict.get("batch_size", 1000),
             "headers": config_dict.get("headers", {}),
             "auth_token": config_dict.get("auth_token", ""),
-            # Login credentials for dynamic token fetching
-            "login_url": config_dict.get("login_url", ""),
-            "login_email": config_dict.get("login_email", ""),
-            "login_password": config_dict.get("login_password", ""),
+            # Login credentials for dynamic token fetching; projects
+            # without their own credentials fall back to the
+            # environment, never to values baked into the codebase.
+            # SecretStr values must be unwrapped here or the masked
+            # "**********" repr would render into the child config.
+            "login_url": _unmask(config_dict.get("login_url")) or os.environ.get("FRINK_LOGIN_URL", ""),
+            "login_email": _unmask(config_dict.get("login_email")) or os.environ.get("FRINK_LOGIN_EMAIL", ""),
+            "login_password": _unmask(config_dict.get("login_password")) or os.environ.get("FRINK_LOGIN_PASSWORD", ""),
             "start_date_column": config_dict.get("start_date_column", ""),
             "end_date_column": config_dict.get("end_date_column", ""),
         }
@@ -109,6 +195,20 @@ class CodeSynthesizer:
         Extracts Python package dependencies from detector code.
         Returns a list of package specifications (e.g., ['pandas>=2.0.0']).
         """
+        cache_key = tuple(
+            sorted(
+                (
+                    rule.rule_id,
+                    hash(rule.code or ""),
+                    tuple(rule.dependencies or ()),
+                )
+                for rule in rules
+            )
+        )
+        cached = self._deps_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Base dependencies always needed for the script
         base_deps = {
             "polars>=0.20.0",
@@ -125,25 +225,13 @@ class CodeSynthesizer:
             if not rule.code:
                 continue
 
-            # Extract import statements
-            import_pattern = (
-                r"^\s*(?:from\s+([\w.]+)\s+import|import\s+([\w.]+(?:\s*,\s*[\w.]+)*))"
-            )
-
-            for line in rule.code.split("\n"):
-                match = re.match(import_pattern, line)
-                if match:
-                    # Handle 'from X import' or 'import X'
-                    module = match.group(1) or match.group(2)
-                    if module:
-                        # Get the top-level module name
-                        top_level = module.split(".")[0].strip()
-
-                        # Map to package if known
-                        if top_level in IMPORT_TO_PACKAGE:
-                            package = IMPORT_TO_PACKAGE[top_level]
-                            if package:  # Skip stdlib modules (None)
-                                detected_packages.add(package)
+            # Map each imported top-level module to a package if known
+            for top_level in _top_level_imports(rule.code):
+                if top_level in _STDLIB_MODULES:
+                    continue
+                package = IMPORT_TO_PACKAGE.get(top_level)
+                if package:
+                    detected_packages.add(package)
 
             # Add explicit dependencies from the rule model
             if rule.dependencies:
@@ -155,7 +243,11 @@ class CodeSynthesizer:
         logger.debug(
             f"Extracted {len(all_deps)} total dependencies ({len(detected_packages)} detected)"
         )
-        return sorted(list(all_deps))
+        result = sorted(all_deps)
+        if len(self._deps_cache) >= 256:
+            self._deps_cache.clear()
+        self._deps_cache[cache_key] = result
+        return result
 
     def prepare_dependencies_context(
         self, rules: List[DiscrepancyRule]
@@ -184,60 +276,62 @@ class CodeSynthesizer:
         logger.info(
             f"Starting code generation for project {project_id} with {len(rule_set)} rules"
         )
-        # Preserve .git directory if it exists (for deployment workflow)
-        git_dir = output_dir / ".git"
-        git_backup = None
-
-        if git_dir.exists():
-            # Temporarily move .git to preserve it
-            git_backup = output_dir.parent / f".git_backup_{project_id}"
-            shutil.move(str(git_dir), str(git_backup))
-
-        # Clean and recreate output directory
-        if output_dir.exists():
-            shutil.rmtree(output_dir)
-        output_dir.mkdir(parents=True)
-
-        # Restore .git directory if it was backed up
-        if git_backup and git_backup.exists():
-            shutil.move(str(git_backup), str(git_dir))
+        # Build into a sibling staging dir and swap it in with two
+        # renames at the end: the live output_dir is never empty or
+        # half-written, a crash mid-generation leaves the old tree
+        # intact, and the previous files are removed in one deferred
+        # rmtree instead of before generation starts.
+        new_dir = output_dir.parent / f"{output_dir.name}.new"
+        old_dir = output_dir.parent / f"{output_dir.name}.old"
+        for leftover in (new_dir, old_dir):
+            if leftover.exists():
+                shutil.rmtree(leftover)
+        new_dir.mkdir(parents=True)
 
         # 1. Prepare Contexts
         detectors_ctx = self.prepare_detectors_context(rule_set)
         config_ctx = self.prepare_config_context(data_source_config)
         deps_ctx = self.prepare_dependencies_context(rule_set)
 
-        # 2. Define Template Map (Template Name -> Output Filename)
-        template_map = {
-            "logic/__init__.py.j2": "logic/__init__.py",
-            "logic/detectors.py.j2": "logic/detectors.py",
-            "logic/processor.py.j2": "logic/processor.py",
-            "utils/__init__.py.j2": "utils/__init__.py",
-            "utils/data_loader.py.j2": "utils/data_loader.py",
-            "main.py.j2": "main.py",
-            "config.py.j2": "config.py",
-            "pyproject.toml.j2": "pyproject.toml",
-            ".gitignore.j2": ".gitignore",
-        }
-
-        # 3. Render and Write
-        logger.info(f"Rendering {len(template_map)} templates to {output_dir}")
-        for tmpl_name, out_name in template_map.items():
-            template = self.env.get_template(tmpl_name)
-
-            # Pass all contexts to templates
-            rendered_code = template.render(
+        # 2. Render all templates serially (templates precompiled in
+        # __init__; rendering is CPU work and shares the contexts)
+        logger.info(f"Rendering {len(_TEMPLATE_MAP)} templates to {output_dir}")
+        pairs = []
+        for tmpl_name, out_name in _TEMPLATE_MAP.items():
+            rendered_code = self._templates[tmpl_name].render(
                 project_id=project_id,
                 detectors=detectors_ctx,
                 config=config_ctx,
                 dependencies=deps_ctx["dependencies"],
             )
+            # Encode up front: write_bytes below issues one plain
+            # write() per file, with no TextIOWrapper/codec layer built
+            # and torn down around a single already-complete string.
+            pairs.append((new_dir / out_name, rendered_code.encode("utf-8")))
+
+        # 3. Create subdirectories (e.g., logic/, utils/) once, deduped,
+        # then write the independent files concurrently — the write
+        # phase is bound by filesystem latency, not CPU.
+        for parent in {dest_path.parent for dest_path, _ in pairs}:
+            parent.mkdir(parents=True, exist_ok=True)
 
-            # Handle subdirectory creation (e.g., logic/, utils/)
-            dest_path = output_dir / out_name
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for _ in pool.map(
+                lambda pair: pair[0].write_bytes(pair[1]), pairs
+            ):
+                pass
 
-            with open(dest_path, "w") as f:
-                f.write(rendered_code)
+        # 4. Preserve .git if it exists (for deployment workflow), then
+        # swap the staged tree into place. Staging dir is a sibling, so
+        # both moves are same-filesystem renames, not copies.
+        git_dir = output_dir / ".git"
+        if git_dir.exists():
+            shutil.move(str(git_dir), str(new_dir / ".git"))
+
+        if output_dir.exists():
+            os.rename(output_dir, old_dir)
+        os.rename(new_dir, output_dir)
+        if old_dir.exists():
+            shutil.rmtree(old_dir)
 
         logger.info(f"Child Codebase generated at: {output_dir}")
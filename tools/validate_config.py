@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+"""
+Static validation for the Settings class.
+
+Run as a pre-commit hook so config mistakes are caught at commit time
+instead of relying on runtime default-checking in every process.
+"""
+import sys
+from dataclasses import MISSING, fields
+from pathlib import Path
+
+# Make the repository root importable when run from pre-commit
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import Settings  # noqa: E402
+
+
+def main() -> int:
+    errors = []
+
+    for field in fields(Settings):
+        if field.default is MISSING and field.default_factory is MISSING:
+            errors.append(f"Settings.{field.name} has no default value")
+
+    if errors:
+        for error in errors:
+            print(f"ERROR: {error}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())